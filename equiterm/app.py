@@ -2,6 +2,8 @@
 Main Equiterm application with theme support.
 """
 
+from typing import Optional, Set
+
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.binding import Binding
@@ -770,8 +772,8 @@ class EquitermApp(App):
     #price-graph {
         width: auto;
         height: auto;
-        min-height: 25;
-        min-width: 70;
+        min-height: 14;
+        min-width: 34;
         border: round $panel-lighten-2;
         padding: 1;
         background: $surface;
@@ -796,6 +798,8 @@ class EquitermApp(App):
         super().__init__()
         self.title = "EquiTerm"
         self.sub_title = ""
+        # Watchlist names shared across screens; None until first read or after a mutation
+        self.watchlist_names_cache: Optional[Set[str]] = None
     
     def get_css_variables(self) -> dict[str, str]:
         """Get theme-specific CSS variables."""
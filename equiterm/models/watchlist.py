@@ -15,6 +15,10 @@ class SymbolType(Enum):
     MUTUAL_FUND = "mutual_fund"
 
 
+# Label shown in the Type column of symbol tables
+SYMBOL_TYPE_LABELS = {symbol_type: symbol_type.value.upper() for symbol_type in SymbolType}
+
+
 @dataclass
 class Symbol:
     """Represents a financial symbol (stock, ETF, mutual fund, etc.)."""
@@ -320,6 +320,7 @@ class CreateWatchlistScreen(Screen):
         
         # Save to storage
         if storage.save_watchlist(watchlist):
+            self.app.watchlist_names_cache = None
             self._update_status(
                 f"✓ Watchlist '{self.watchlist_name}' saved with {len(self.symbols)} symbols!",
                 "success"
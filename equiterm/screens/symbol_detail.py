@@ -1,26 +1,395 @@
+import asyncio
+
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, VerticalScroll, ScrollableContainer
 from textual.screen import Screen
 from textual.widgets import Button, Header, Footer, Static, DataTable, LoadingIndicator
 from textual.binding import Binding
-from textual import log, events
+from textual import log, events, work
+from textual.worker import get_current_worker
 from rich.text import Text
 from datetime import date, timedelta
-import plotext as plt
+from functools import lru_cache
+from typing import Callable, Final, Optional, Tuple
 
 from ..services.data_fetcher import data_fetcher
 from ..services.storage import storage
+from ..services.history_cache import history_cache
 from ..utils.symbol_detector import symbol_detector
 from ..utils.calculations import format_currency, format_percentage
+from ..utils.styles import S_GREEN, S_RED, S_YELLOW
 from ..models.watchlist import (
     SymbolType, MarketData, StockData, IndexData, ETFData, MutualFundData
 )
 
-try:
-    from jugaad_data.nse import stock_df, index_df
-except ImportError:
-    stock_df = None
-    index_df = None
+# plotext is imported on the first plot, see _plotext()
+_plt = None
+
+# Cell values and section headers shared by every render
+_BLANK: Final[str] = ""
+_YES: Final[str] = "Yes"
+_NO: Final[str] = "No"
+_HEAD_PRICE: Final[str] = "📊 PRICE INFORMATION"
+_HEAD_LIMITS: Final[str] = "📉 LIMITS & RANGE"
+_HEAD_VOLUME_LIQUIDITY: Final[str] = "📈 VOLUME & LIQUIDITY"
+_HEAD_FUNDAMENTALS: Final[str] = "📊 FUNDAMENTALS"
+_HEAD_TRADING: Final[str] = "🔄 TRADING INFO"
+_HEAD_YEAR_RANGE: Final[str] = "📉 YEAR RANGE"
+_HEAD_COMPOSITION: Final[str] = "📈 INDEX COMPOSITION"
+_HEAD_PERFORMANCE: Final[str] = "📊 PERFORMANCE"
+_HEAD_VOLUME_MCAP: Final[str] = "📈 VOLUME & MARKET CAP"
+_HEAD_NAV_PREMIUM: Final[str] = "💰 NAV & PREMIUM/DISCOUNT"
+_HEAD_ETF_DETAILS: Final[str] = "📊 ETF DETAILS"
+_HEAD_NAV: Final[str] = "💰 NAV INFORMATION"
+_HEAD_RETURNS: Final[str] = "📊 RETURNS"
+_HEAD_FUND_DETAILS: Final[str] = "📈 FUND DETAILS"
+_HEAD_VOLUME: Final[str] = "📈 VOLUME"
+
+# Symbol types with NSE price history
+_HISTORY_TYPES: Final = frozenset({SymbolType.EQUITY, SymbolType.ETF, SymbolType.INDEX})
+
+# Fetches faster than this never show the loading indicator
+_LOADING_DELAY: Final[float] = 0.1
+
+# Fixed column widths so DataTable does not re-measure cells on every add_row;
+# the widest label is "💰 NAV & PREMIUM/DISCOUNT" (25 cells)
+_FIELD_WIDTH: Final[int] = 26
+_VALUE_WIDTH: Final[int] = 48
+
+# Smallest price chart in terminal cells; it otherwise fills the space beside
+# the data table and the height of the screen
+_MIN_PLOT_WIDTH: Final[int] = 30
+_MIN_PLOT_HEIGHT: Final[int] = 10
+
+# Pre-bound formatters for the numeric cells; volumes and sizes repeat across
+# refreshes, so the thousands formatter is memoised
+_FMT_INT = lru_cache(maxsize=2048)("{:,}".format)
+_FMT_DECIMAL = "{:.2f}".format
+_FMT_PERCENT = "{:.2f}%".format
+
+def _plotext():
+    """Import plotext on first use."""
+    global _plt
+    if _plt is None:
+        import plotext
+        _plt = plotext
+    return _plt
+
+
+def _outer_height(widget) -> int:
+    """Height a widget takes up in the layout, including its margin."""
+    return widget.outer_size.height + widget.styles.margin.height
+
+
+def _has_any(data, fields: tuple) -> bool:
+    """Return True if any of the given fields is set on data."""
+    return any(getattr(data, field, None) is not None for field in fields)
+
+
+def _append_section_header(rows: list, header: str) -> None:
+    """Append a section header preceded by one blank spacer row."""
+    rows.append((_BLANK, _BLANK))
+    rows.append((header, _BLANK))
+
+
+# Cell formatters for the field schemas. Each takes the field value and the data
+# object, and returns the cell or None to leave the row out.
+
+def _fmt_text(value, data):
+    return value or None
+
+
+def _fmt_as_is(value, data):
+    return value
+
+
+def _fmt_str(value, data):
+    return str(value)
+
+
+def _fmt_currency(value, data):
+    return format_currency(value)
+
+
+def _fmt_numeric_currency(value, data):
+    return format_currency(value) if isinstance(value, (int, float)) else None
+
+
+def _fmt_change_percent(value, data):
+    return format_percentage(value)
+
+
+def _fmt_percent(value, data):
+    return _FMT_PERCENT(value)
+
+
+def _fmt_decimal(value, data):
+    return _FMT_DECIMAL(value)
+
+
+def _fmt_int(value, data):
+    return _FMT_INT(value)
+
+
+def _fmt_units(value, data):
+    return f"{_FMT_INT(value)} units"
+
+
+def _fmt_yes_no(value, data):
+    return _YES if value else _NO
+
+
+def _fmt_price_band(value, data):
+    return f"{value}%" if value else None
+
+
+def _priced(value, previous, text: str):
+    """Colour text green or red by how value compares with previous."""
+    if previous is None or value == previous:
+        return text
+    return Text(text, style=S_GREEN if value > previous else S_RED)
+
+
+def _fmt_vs_previous_close(value, data):
+    """Currency, coloured green/red against the previous close."""
+    return _priced(value, data.previous_close, format_currency(value))
+
+
+def _fmt_premium(value, data):
+    """Percentage, coloured by how far the ETF trades from its NAV."""
+    text = format_percentage(value)
+    abs_premium = abs(value)
+    if abs_premium > 10:
+        return Text(text, style=S_RED)
+    if abs_premium >= 5:
+        return Text(text, style=S_YELLOW)
+    return Text(text, style=S_GREEN)
+
+
+def _fmt_week_high(value, data):
+    text = format_currency(value)
+    return f"{text} ({data.week_high_date})" if data.week_high_date else text
+
+
+def _fmt_week_low(value, data):
+    text = format_currency(value)
+    return f"{text} ({data.week_low_date})" if data.week_low_date else text
+
+
+def _section(header: Optional[str], *fields: Tuple[str, Optional[str], Callable]) -> tuple:
+    """
+    Build a schema section.
+    
+    Args:
+        header: Section header, or None for the untitled leading section
+        fields: (label, attribute, formatter) per row; attribute None is the type label
+    
+    Returns:
+        (header, attributes that gate the section, fields)
+    """
+    attrs = tuple(attr for _, attr, _ in fields if attr is not None)
+    return header, attrs, fields
+
+
+_SYMBOL_FIELD = ("Symbol", "symbol", _fmt_as_is)
+_TYPE_FIELD = ("Type", None, _fmt_as_is)
+
+_PRICE_SECTION = _section(
+    _HEAD_PRICE,
+    ("Current Price", "current_price", _fmt_currency),
+    ("Open Price", "open_price", _fmt_currency),
+    ("Close Price", "close_price", _fmt_vs_previous_close),
+    ("Day High", "high_price", _fmt_currency),
+    ("Day Low", "low_price", _fmt_currency),
+    ("Previous Close", "previous_close", _fmt_currency),
+    ("VWAP", "vwap", _fmt_currency),
+    ("Change", "change", _fmt_currency),
+    ("Change %", "change_percent", _fmt_change_percent),
+)
+_LIMITS_SECTION = _section(
+    _HEAD_LIMITS,
+    ("Lower Circuit", "lower_circuit", _fmt_currency),
+    ("Upper Circuit", "upper_circuit", _fmt_currency),
+    ("Price Band", "price_band_percent", _fmt_price_band),
+    ("52-Week High", "week_high", _fmt_week_high),
+    ("52-Week Low", "week_low", _fmt_week_low),
+)
+_VOLUME_LIQUIDITY_SECTION = _section(
+    _HEAD_VOLUME_LIQUIDITY,
+    ("Volume", "volume", _fmt_int),
+    ("Value", "value", _fmt_currency),
+    ("Total Buy Qty", "total_buy_quantity", _fmt_int),
+    ("Total Sell Qty", "total_sell_quantity", _fmt_int),
+)
+_TRADING_SECTION = _section(
+    _HEAD_TRADING,
+    ("F&O Available", "is_fno", _fmt_yes_no),
+    ("SLB Available", "is_slb", _fmt_yes_no),
+    ("ETF Security", "is_etf_sec", _fmt_yes_no),
+)
+
+STOCK_SCHEMA: Final = (
+    _section(
+        None,
+        ("Company", "company_name", _fmt_text),
+        _SYMBOL_FIELD,
+        _TYPE_FIELD,
+        ("Industry", "industry", _fmt_text),
+        ("Sector", "sector", _fmt_text),
+        ("ISIN", "isin", _fmt_text),
+    ),
+    _PRICE_SECTION,
+    _LIMITS_SECTION,
+    _VOLUME_LIQUIDITY_SECTION,
+    _section(
+        _HEAD_FUNDAMENTALS,
+        ("Market Cap", "market_cap", _fmt_currency),
+        ("P/E Ratio", "pe_ratio", _fmt_decimal),
+        ("Dividend Yield", "dividend_yield", _fmt_change_percent),
+        ("Face Value", "face_value", _fmt_currency),
+        ("Issued Size", "issued_size", _fmt_int),
+    ),
+    _TRADING_SECTION,
+)
+
+INDEX_SCHEMA: Final = (
+    _section(
+        None,
+        ("Index Name", "index_name", _fmt_text),
+        _SYMBOL_FIELD,
+        _TYPE_FIELD,
+        ("Market Status", "market_status", _fmt_text),
+        ("Status Message", "market_status_message", _fmt_text),
+    ),
+    _section(
+        _HEAD_PRICE,
+        ("Current Level", "current_price", _fmt_vs_previous_close),
+        ("Open", "open_price", _fmt_currency),
+        ("Day High", "high_price", _fmt_currency),
+        ("Day Low", "low_price", _fmt_currency),
+        ("Previous Close", "previous_close", _fmt_currency),
+        ("Change", "change", _fmt_currency),
+        ("Change %", "change_percent", _fmt_change_percent),
+    ),
+    _section(
+        _HEAD_YEAR_RANGE,
+        ("Year High", "year_high", _fmt_currency),
+        ("Year Low", "year_low", _fmt_currency),
+        ("Near Week High", "near_week_high", _fmt_percent),
+        ("Near Week Low", "near_week_low", _fmt_percent),
+    ),
+    _section(
+        _HEAD_COMPOSITION,
+        ("Advances", "advances", _fmt_str),
+        ("Declines", "declines", _fmt_str),
+        ("Unchanged", "unchanged", _fmt_str),
+    ),
+    _section(
+        _HEAD_PERFORMANCE,
+        ("1-Year Return", "percent_change_365d", _fmt_change_percent),
+        ("1-Month Return", "percent_change_30d", _fmt_change_percent),
+    ),
+    _section(
+        _HEAD_VOLUME_MCAP,
+        ("Total Volume", "volume", _fmt_int),
+        ("Total Value", "value", _fmt_currency),
+        ("Free Float Mkt Cap", "total_market_cap", _fmt_currency),
+    ),
+)
+
+ETF_SCHEMA: Final = (
+    _section(
+        None,
+        ("ETF Name", "company_name", _fmt_text),
+        _SYMBOL_FIELD,
+        _TYPE_FIELD,
+        ("ISIN", "isin", _fmt_text),
+        ("Industry", "industry", _fmt_text),
+        ("Sector", "sector", _fmt_text),
+        ("Underlying Index", "underlying_index", _fmt_text),
+        ("Listing Date", "listing_date", _fmt_text),
+    ),
+    _PRICE_SECTION,
+    _section(
+        _HEAD_NAV_PREMIUM,
+        ("NAV", "nav", _fmt_currency),
+        ("Premium/Discount", "premium_discount", _fmt_premium),
+    ),
+    _LIMITS_SECTION,
+    _VOLUME_LIQUIDITY_SECTION,
+    _section(
+        _HEAD_ETF_DETAILS,
+        ("Face Value", "face_value", _fmt_numeric_currency),
+        ("Issued Size", "issued_size", _fmt_units),
+        ("Tick Size", "tick_size", _fmt_currency),
+    ),
+    _TRADING_SECTION,
+)
+
+GENERIC_SCHEMA: Final = (
+    _section(None, _SYMBOL_FIELD, _TYPE_FIELD),
+    _PRICE_SECTION,
+    _section(
+        _HEAD_VOLUME,
+        ("Volume", "volume", _fmt_int),
+        ("Value", "value", _fmt_currency),
+    ),
+)
+
+MUTUAL_FUND_SCHEMA: Final = (
+    _section(
+        None,
+        ("Scheme Name", "scheme_name", _fmt_text),
+        ("Scheme Code", "symbol", _fmt_as_is),
+        _TYPE_FIELD,
+        ("Fund House", "fund_house", _fmt_text),
+        ("Scheme Type", "scheme_type", _fmt_text),
+        ("Category", "scheme_category", _fmt_text),
+    ),
+    _section(
+        _HEAD_NAV,
+        ("Current NAV", "nav", _fmt_currency),
+    ),
+    _section(
+        _HEAD_RETURNS,
+        ("1-Year Return", "returns_1y", _fmt_change_percent),
+        ("3-Year Return", "returns_3y", _fmt_change_percent),
+        ("5-Year Return", "returns_5y", _fmt_change_percent),
+    ),
+    _section(
+        _HEAD_FUND_DETAILS,
+        ("AUM", "aum", _fmt_currency),
+        ("Expense Ratio", "expense_ratio", _fmt_percent),
+    ),
+)
+
+
+def _render_fields(rows: list, data: MarketData, schema: tuple, type_label: str) -> None:
+    """Append the rows described by schema for data, skipping empty fields and sections."""
+    append = rows.append
+    for header, attrs, fields in schema:
+        if header is not None and not _has_any(data, attrs):
+            continue
+        
+        # Header goes in before the first field that produces a cell
+        pending_header = header
+        for label, attr, formatter in fields:
+            value = type_label if attr is None else getattr(data, attr, None)
+            if value is None:
+                continue
+            cell = formatter(value, data)
+            if cell is None:
+                continue
+            if pending_header is not None:
+                _append_section_header(rows, pending_header)
+                pending_header = None
+            append((label, cell))
+    
+    # Last Updated
+    if data.last_updated:
+        rows.append((_BLANK, _BLANK))
+        rows.append(("Last Updated", data.last_updated))
+
 
 class SymbolDetailScreen(Screen):
     BINDINGS = [
@@ -31,15 +400,33 @@ class SymbolDetailScreen(Screen):
         Binding("up", "focus_previous", "Previous", show=False),
     ]
 
-    def __init__(self, symbol: str, cached_etf_data=None):
+    def __init__(self, symbol: str, cached_etf_data=None, cached_data=None):
         super().__init__()
         self.symbol = symbol
         self.symbol_type, self.scheme_code = symbol_detector.detect_symbol_type(symbol)
+        self._symbol_type_label = self.symbol_type.value.upper() if self.symbol_type else ""
         self.data_table = None
         self.graph_widget = None
+        self.graph_status = None
+        self.watchlist_button = None
+        self.main_scroll = None
+        self.heading = None
+        self.content_row = None
+        self.left_panel = None
+        self.right_panel = None
+        self.button_row = None
+        self.loading_indicator = None  # Mounted only while a slow fetch is running
+        self.error_container = None  # Mounted only when no data is found
         self.historical_data = None
+        self._plot_cache: dict = {}  # (symbol, rows, last row, size) -> (plot text, status)
         self.current_data = None  # Store current MarketData for full_name extraction
         self.cached_etf_data = cached_etf_data  # Cached ETF data from watchlist view
+        self.cached_data = cached_data  # Data prefetched by the watchlist view, any type
+        self._rows_buf: list = []  # Reused by every render; add_rows copies the cells
+        # Last rendered layout, so a refresh with the same fields only updates changed values
+        self._row_keys: list = []
+        self._row_labels = None
+        self._row_values: list = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -50,34 +437,44 @@ class SymbolDetailScreen(Screen):
                 with Vertical(id="detail-left-panel"):
                     self.data_table = DataTable(id="detail-table")
                     yield self.data_table
-                    yield LoadingIndicator(id="detail-loading")
                 # Right side: Graph
                 with Vertical(id="detail-right-panel"):
                     self.graph_widget = Static("", id="price-graph")
                     yield self.graph_widget
                     yield Static("Loading historical data...", id="graph-status")
-            # Error message container (hidden by default)
-            with Container(id="error-message-container"):
-                with Vertical(id="error-content"):
-                    yield Static("⚠️", id="error-icon")
-                    yield Static("No data found for this symbol", id="error-text")
-                    yield Static(f"Symbol: {self.symbol}", id="error-symbol")
-                    yield Static("Please check the symbol name and try again.", id="error-hint")
             with Horizontal(id="detail-button-row"):
                 yield Button("Add to Watchlist", id="add-watchlist-button", variant="primary")
         yield Footer()
 
-    def on_mount(self) -> None:
-        self.data_table.add_columns("Field", "Value")
+    async def on_mount(self) -> None:
+        self.data_table.add_column("Field", width=_FIELD_WIDTH, key="field")
+        self.data_table.add_column("Value", width=_VALUE_WIDTH, key="value")
         self.data_table.cursor_type = "row"
-        self.query_one("#detail-loading").display = True
-        self.query_one("#error-message-container").display = False  # Hide error by default
+        self.graph_status = self.query_one("#graph-status", Static)
+        self.watchlist_button = self.query_one("#add-watchlist-button", Button)
+        self.main_scroll = self.query_one("#detail-main-scroll", VerticalScroll)
+        self.heading = self.query_one("#symbol-heading", Static)
+        self.content_row = self.query_one("#detail-content-row", Horizontal)
+        self.left_panel = self.query_one("#detail-left-panel", Vertical)
+        self.right_panel = self.query_one("#detail-right-panel", Vertical)
+        self.button_row = self.query_one("#detail-button-row", Horizontal)
         self._update_watchlist_button()
-        self.set_timer(0.1, self.load_symbol_data)  # Defer to ensure render
-        self.set_timer(0.2, self.load_historical_data)  # Load historical data
         
-        # Auto-focus the data table
-        self.call_after_refresh(self._focus_table)
+        # Yield once so the first frame is queued, then focus and start both fetches together
+        await asyncio.sleep(0)
+        self._focus_table()
+        self.load_symbol_data()
+        if self.symbol_type in _HISTORY_TYPES:
+            self.load_historical_data()
+        elif self.symbol_type == SymbolType.MUTUAL_FUND:
+            self.graph_status.update("Historical data not available for mutual funds")
+        else:
+            self.graph_status.update("Historical data not available for this type")
+    
+    def on_unmount(self) -> None:
+        """Cancel in-flight fetches when the screen is closed."""
+        self.workers.cancel_group(self, "symbol")
+        self.workers.cancel_group(self, "history")
     
     def _focus_table(self) -> None:
         """Focus the data table."""
@@ -99,16 +496,13 @@ class SymbolDetailScreen(Screen):
                         # At last row, move to button
                         event.prevent_default()
                         event.stop()
-                        try:
-                            button = self.query_one("#add-watchlist-button", Button)
-                            if not button.disabled:
-                                button.focus()
-                                button.scroll_visible()
-                        except Exception:
-                            pass
+                        button = self.watchlist_button
+                        if not button.disabled:
+                            button.focus()
+                            button.scroll_visible()
         
         elif event.key == "up":
-            if focused == self.query_one("#add-watchlist-button", Button):
+            if focused == self.watchlist_button:
                 # Move from button back to table
                 event.prevent_default()
                 event.stop()
@@ -125,80 +519,151 @@ class SymbolDetailScreen(Screen):
 
     def _update_watchlist_button(self) -> None:
         """Disable 'Add to Watchlist' button if no watchlists exist."""
-        watchlist_button = self.query_one("#add-watchlist-button")
-        has_watchlists = bool(storage.list_watchlist_names())
-        watchlist_button.disabled = not has_watchlists
+        names = self.app.watchlist_names_cache
+        if names is None:
+            # Fill the cache so later detail screens skip the storage read
+            names = self.app.watchlist_names_cache = set(storage.list_watchlist_names())
+        self.watchlist_button.disabled = not names
 
     def load_symbol_data(self) -> None:
-        self.data_table.clear()
-        self.query_one("#detail-loading").display = True
-        
-        # Use cached ETF data if available, otherwise fetch
+        self._loading_timer = self.set_timer(_LOADING_DELAY, self._mount_loading)
+        self._fetch_symbol_data()
+    
+    @work(thread=True, exclusive=True, group="symbol")
+    def _fetch_symbol_data(self) -> None:
+        """Fetch symbol data in a worker thread."""
+        # Use cached or prefetched data if available, otherwise fetch
         if self.cached_etf_data and self.symbol_type == SymbolType.ETF:
             data = self.cached_etf_data
+        elif self.cached_data is not None and self.cached_data.symbol_type == self.symbol_type:
+            data = self.cached_data
         else:
             # Try live fetch, fallback to demo data
             data = data_fetcher.fetch_symbol_data(self.symbol, self.symbol_type, self.scheme_code)
         
-        log(
-            f"PRATIK: Symbol: {self.symbol}, "
-            f"Symbol Type: {self.symbol_type}, "
-            f"Scheme Code: {self.scheme_code}, "
-            f"Data: {data}"
+        # Pass values as arguments so the data repr is only built when devtools is attached
+        self.log(
+            "PRATIK: Symbol:", self.symbol,
+            "Symbol Type:", self.symbol_type,
+            "Scheme Code:", self.scheme_code,
+            "Data:", data,
         )
-        self.query_one("#detail-loading").display = False
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._on_symbol_data, data)
+    
+    def _on_symbol_data(self, data: MarketData) -> None:
+        """Display fetched symbol data on the UI thread."""
+        self._loading_timer.stop()
+        self._unmount_loading()
         self._display_data(data)
+        # The table width decides the room left for the chart
+        self._schedule_plot()
+    
+    def _mount_loading(self) -> None:
+        """Show the loading indicator once the fetch is slow enough to notice."""
+        self.loading_indicator = LoadingIndicator(id="detail-loading")
+        self.left_panel.mount(self.loading_indicator)
     
+    def _unmount_loading(self) -> None:
+        """Remove the loading indicator if it was mounted."""
+        if self.loading_indicator is not None:
+            self.loading_indicator.remove()
+            self.loading_indicator = None
+    
+    @work(thread=True, exclusive=True, group="history")
     def load_historical_data(self) -> None:
-        """Load and display historical data for the last 30 days."""
+        """Load historical data for the last 30 days in a worker thread."""
+        df, status = self._fetch_historical_data()
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._on_historical_data, df, status)
+    
+    def _fetch_historical_data(self):
+        """Return (DataFrame, None) on success, or (None, status message)."""
         try:
-            if stock_df is None or index_df is None:
-                self.query_one("#graph-status").update("jugaad_data not available")
-                return
+            # Imported here so the import runs in the worker thread, not on screen open
+            try:
+                from jugaad_data.nse import stock_df, index_df
+            except ImportError:
+                return None, "jugaad_data not available"
             
             # Calculate date range (last 30 days)
             to_date = date.today()
             from_date = to_date - timedelta(days=30)
             
-            # Fetch historical data based on symbol type
-            df = None
-            if self.symbol_type in [SymbolType.EQUITY, SymbolType.ETF]:
-                try:
-                    df = stock_df(
-                        symbol=self.symbol,
-                        from_date=from_date,
-                        to_date=to_date,
-                        series="EQ"
-                    )
-                except Exception as e:
-                    log(f"Error fetching stock data for {self.symbol}: {e}")
-                    self.query_one("#graph-status").update(f"Error: {str(e)[:50]}")
-                    return
-            elif self.symbol_type == SymbolType.INDEX:
-                try:
-                    df = index_df(
-                        symbol=self.symbol,
-                        from_date=from_date,
-                        to_date=to_date
-                    )
-                except Exception as e:
-                    log(f"Error fetching index data for {self.symbol}: {e}")
-                    self.query_one("#graph-status").update(f"Error: {str(e)[:50]}")
-                    return
-            else:
-                self.query_one("#graph-status").update("Historical data not available for this type")
-                return
+            # Serve from the on-disk cache while it is fresh
+            cache_key = (self.symbol_type.value, self.symbol, from_date, to_date)
+            df = history_cache.get(cache_key)
+            if df is None:
+                # Fetch historical data based on symbol type
+                if self.symbol_type == SymbolType.INDEX:
+                    try:
+                        df = index_df(
+                            symbol=self.symbol,
+                            from_date=from_date,
+                            to_date=to_date
+                        )
+                    except Exception as e:
+                        log(f"Error fetching index data for {self.symbol}: {e}")
+                        return None, f"Error: {str(e)[:50]}"
+                else:
+                    try:
+                        df = stock_df(
+                            symbol=self.symbol,
+                            from_date=from_date,
+                            to_date=to_date,
+                            series="EQ"
+                        )
+                    except Exception as e:
+                        log(f"Error fetching stock data for {self.symbol}: {e}")
+                        return None, f"Error: {str(e)[:50]}"
+                if df is not None and not df.empty:
+                    history_cache.set(cache_key, df)
             
             if df is None or df.empty:
-                self.query_one("#graph-status").update("No historical data available")
-                return
+                return None, "No historical data available"
             
-            self.historical_data = df
-            self._plot_historical_data()
+            return df, None
             
         except Exception as e:
             log(f"Error loading historical data: {e}")
-            self.query_one("#graph-status").update(f"Error: {str(e)[:50]}")
+            return None, f"Error: {str(e)[:50]}"
+    
+    def _on_historical_data(self, df, status) -> None:
+        """Plot fetched historical data, or show why there is none, on the UI thread."""
+        if df is None:
+            self.graph_status.update(status)
+            return
+        
+        self.historical_data = df
+        self._schedule_plot()
+    
+    def on_resize(self, event: events.Resize) -> None:
+        """Re-plot the chart to fit the new panel size."""
+        self._schedule_plot()
+    
+    def _schedule_plot(self) -> None:
+        """Plot the chart once the layout is updated, so it is sized to the final panels."""
+        if self.historical_data is not None:
+            self.call_after_refresh(self._plot_historical_data)
+    
+    def _plot_size(self) -> Tuple[int, int]:
+        """Return the chart size that fills the space beside the data table."""
+        width = (
+            self.content_row.content_size.width
+            - self.left_panel.outer_size.width
+            - self.right_panel.styles.gutter.width
+            - self.graph_widget.styles.gutter.width
+        )
+        # Visible height less everything stacked above, below and around the chart
+        height = (
+            self.main_scroll.scrollable_content_region.height
+            - _outer_height(self.heading)
+            - _outer_height(self.watchlist_button)
+            - _outer_height(self.graph_status)
+            - self.right_panel.styles.gutter.height
+            - self.graph_widget.styles.gutter.height
+        )
+        return max(_MIN_PLOT_WIDTH, width), max(_MIN_PLOT_HEIGHT, height)
     
     def _plot_historical_data(self) -> None:
         """Plot historical price data using plotext."""
@@ -208,6 +673,21 @@ class SymbolDetailScreen(Screen):
             
             df = self.historical_data
             
+            # Reuse the rendered chart if the same data was plotted at this size before
+            plot_width, plot_height = self._plot_size()
+            cache_key = (self.symbol, len(df), tuple(df.iloc[-1]), plot_width, plot_height)
+            cached = self._plot_cache.get(cache_key)
+            if cached is not None:
+                plot_text, status = cached
+                self.graph_widget.update(plot_text)
+                self.graph_status.update(status)
+                return
+            
+            # Imported on the first plot, like plotext, so opening the screen stays cheap
+            import numpy as np
+            import pandas as pd
+            from ..utils.downsample import minmax_lttb
+            
             # Use all data points except the last one (29 out of 30)
             if len(df) > 1:
                 df = df.iloc[:-1]  # Exclude last data point
@@ -219,44 +699,40 @@ class SymbolDetailScreen(Screen):
                 df = df.sort_values('HistoricalDate', ascending=True).reset_index(drop=True)
             
             # Clear previous plot
+            plt = _plotext()
             plt.clear_figure()
             plt.clear_data()
             plt.clear_color()
             
-            # Extract dates and close prices
-            dates = []
-            if 'DATE' in df.columns:
-                dates = df['DATE'].tolist()
-            elif 'HistoricalDate' in df.columns:
-                dates = df['HistoricalDate'].tolist()
-            else:
-                dates = list(range(len(df)))
-            
+            # Extract close prices
             if 'CLOSE' in df.columns:
-                close_prices = df['CLOSE'].tolist()
+                close_prices = df['CLOSE'].to_numpy(dtype=np.float64, copy=False)
             elif 'close' in df.columns:
-                close_prices = df['close'].tolist()
+                close_prices = df['close'].to_numpy(dtype=np.float64, copy=False)
             else:
-                self.query_one("#graph-status").update("Close price column not found")
+                self.graph_status.update("Close price column not found")
                 return
             
             # Convert dates to day number only (DD format)
-            date_labels = []
-            for d in dates:
-                if isinstance(d, str):
-                    # Parse string date and format as day number only
-                    try:
-                        from datetime import datetime
-                        parsed_date = datetime.strptime(d[:10], "%Y-%m-%d")
-                        date_labels.append(parsed_date.strftime("%d"))
-                    except:
-                        date_labels.append(d[:2])  # Fallback to first 2 chars
-                else:
-                    date_labels.append(str(d))
+            if 'DATE' in df.columns or 'HistoricalDate' in df.columns:
+                date_col = df['DATE'] if 'DATE' in df.columns else df['HistoricalDate']
+                date_labels = (
+                    pd.to_datetime(date_col, errors='coerce', cache=True)
+                    .dt.strftime("%d")
+                    .fillna(date_col.astype(str).str[:2])  # Fallback to first 2 chars
+                    .to_numpy()
+                )
+            else:
+                date_labels = [str(i) for i in range(len(df))]
             
             # Create the plot with date labels on x-axis
-            x_indices = list(range(len(close_prices)))
-            plt.plot(x_indices, close_prices, marker="braille")
+            x_indices = np.arange(len(close_prices))
+            if len(close_prices) > 2 * plot_width:
+                # Most points of a long series share a cell; plot a representative subset
+                keep = minmax_lttb(close_prices, 2 * plot_width)
+                plt.plot(keep, close_prices[keep], marker="braille")
+            else:
+                plt.plot(x_indices, close_prices, marker="braille")
             plt.title(f"{self.symbol} - 30 Day Price Chart")
             plt.xlabel("Date")
             plt.ylabel("Close Price (Rs)")
@@ -264,8 +740,8 @@ class SymbolDetailScreen(Screen):
             # Set custom x-axis labels (show all or subset based on count)
             # Since we're only showing day numbers, we can display more data points
             if len(date_labels) > 15:
-                # Show every 3rd day to keep it readable
-                step = 3
+                # Show every 3rd day (or fewer on long series) to keep it readable
+                step = max(3, len(date_labels) // 20)
                 xticks = list(range(0, len(date_labels), step))
                 xlabels = [date_labels[i] for i in xticks]
                 plt.xticks(xticks, xlabels)
@@ -274,18 +750,22 @@ class SymbolDetailScreen(Screen):
                 plt.xticks(x_indices, date_labels)
             
             # Set plot size to fit the right panel (approximately)
-            plt.plot_size(width=70, height=25)
+            plt.plot_size(width=plot_width, height=plot_height)
             
-            # Generate the plot as text
-            plot_text = plt.build()
+            # Generate the plot as text; decode plotext's ANSI codes so they are not
+            # shown literally or counted towards the width, and drop the trailing
+            # newline so the chart is exactly plot_height lines
+            plot_text = Text.from_ansi(plt.build().rstrip("\n"))
             
             # Update the graph widget
+            status = f"Data points: {len(close_prices)}"
+            self._plot_cache[cache_key] = (plot_text, status)
             self.graph_widget.update(plot_text)
-            self.query_one("#graph-status").update(f"Data points: {len(close_prices)}")
+            self.graph_status.update(status)
             
         except Exception as e:
             log(f"Error plotting data: {e}")
-            self.query_one("#graph-status").update(f"Plot error: {str(e)[:50]}")
+            self.graph_status.update(f"Plot error: {str(e)[:50]}")
 
     def _display_data(self, data: MarketData) -> None:
         """Route to appropriate display method based on data type."""
@@ -297,484 +777,62 @@ class SymbolDetailScreen(Screen):
         self.current_data = data
         
         if isinstance(data, StockData):
-            self._display_stock_data(data)
+            self._render_schema(data, STOCK_SCHEMA)
         elif isinstance(data, IndexData):
-            self._display_index_data(data)
+            self._render_schema(data, INDEX_SCHEMA)
         elif isinstance(data, ETFData):
             self.symbol_type = SymbolType.ETF
-            self._display_etf_data(data)
+            self._symbol_type_label = SymbolType.ETF.value.upper()
+            self._render_schema(data, ETF_SCHEMA)
         elif isinstance(data, MutualFundData):
-            self._display_mutual_fund_data(data)
+            self._render_schema(data, MUTUAL_FUND_SCHEMA)
         else:
             # Fallback for base MarketData
-            self._display_generic_data(data)
+            self._render_schema(data, GENERIC_SCHEMA)
     
     def _display_no_data_message(self) -> None:
         """Display a centered modal-like message when no data is found."""
         # Hide the data table and button row
         self.data_table.display = False
-        self.query_one("#detail-button-row").display = False
-        
-        # Show error message container
-        error_container = self.query_one("#error-message-container")
-        error_container.display = True
-    
-    def _display_stock_data(self, data: StockData) -> None:
-        """Display stock-specific data."""
-        table = self.data_table
-        table.clear()
-        
-        # Company Information
-        if data.company_name:
-            table.add_row("Company", data.company_name)
-        table.add_row("Symbol", data.symbol)
-        table.add_row("Type", data.symbol_type.value.upper())
-        if data.industry:
-            table.add_row("Industry", data.industry)
-        if data.sector:
-            table.add_row("Sector", data.sector)
-        if data.isin:
-            table.add_row("ISIN", data.isin)
-        
-        # Price Information
-        table.add_row("", "")
-        table.add_row("📊 PRICE INFORMATION", "")
-        table.add_row("", "")
-        if data.current_price is not None:
-            table.add_row("Current Price", format_currency(data.current_price))
-        if data.open_price is not None:
-            table.add_row("Open Price", format_currency(data.open_price))
-        
-        # Close Price with color highlighting
-        if data.close_price is not None:
-            close_value = format_currency(data.close_price)
-            # Color highlight based on comparison with previous close
-            if data.previous_close is not None:
-                if data.close_price > data.previous_close:
-                    close_text = Text(close_value, style="bold green")
-                elif data.close_price < data.previous_close:
-                    close_text = Text(close_value, style="bold red")
-                else:
-                    close_text = close_value  # No highlight when equal
-            else:
-                close_text = close_value  # No highlight if no previous close
-            table.add_row("Close Price", close_text)
-        
-        if data.high_price is not None:
-            table.add_row("Day High", format_currency(data.high_price))
-        if data.low_price is not None:
-            table.add_row("Day Low", format_currency(data.low_price))
-        if data.previous_close is not None:
-            table.add_row("Previous Close", format_currency(data.previous_close))
-        if data.vwap is not None:
-            table.add_row("VWAP", format_currency(data.vwap))
-        if data.change is not None:
-            table.add_row("Change", format_currency(data.change))
-        if data.change_percent is not None:
-            table.add_row("Change %", format_percentage(data.change_percent))
-        
-        # Circuit Limits & 52-Week Range
-        if data.lower_circuit or data.upper_circuit or data.week_high or data.week_low:
-            table.add_row("", "")
-            table.add_row("📉 LIMITS & RANGE", "")
-            table.add_row("", "")
-            if data.lower_circuit is not None:
-                table.add_row("Lower Circuit", format_currency(data.lower_circuit))
-            if data.upper_circuit is not None:
-                table.add_row("Upper Circuit", format_currency(data.upper_circuit))
-            if data.week_high is not None:
-                week_high_str = format_currency(data.week_high)
-                if data.week_high_date:
-                    week_high_str += f" ({data.week_high_date})"
-                table.add_row("52-Week High", week_high_str)
-            if data.week_low is not None:
-                week_low_str = format_currency(data.week_low)
-                if data.week_low_date:
-                    week_low_str += f" ({data.week_low_date})"
-                table.add_row("52-Week Low", week_low_str)
-        
-        # Volume & Liquidity
-        if data.volume is not None or data.value is not None or data.total_buy_quantity or data.total_sell_quantity:
-            table.add_row("", "")
-            table.add_row("📈 VOLUME & LIQUIDITY", "")
-            table.add_row("", "")
-            if data.volume is not None:
-                table.add_row("Volume", f"{data.volume:,}")
-            if data.value is not None:
-                table.add_row("Value", format_currency(data.value))
-            if data.total_buy_quantity is not None:
-                table.add_row("Total Buy Qty", f"{data.total_buy_quantity:,}")
-            if data.total_sell_quantity is not None:
-                table.add_row("Total Sell Qty", f"{data.total_sell_quantity:,}")
+        self.button_row.display = False
         
-        # Fundamentals
-        if data.market_cap or data.pe_ratio or data.dividend_yield or data.face_value or data.issued_size:
-            table.add_row("", "")
-            table.add_row("📊 FUNDAMENTALS", "")
-            table.add_row("", "")
-            if data.market_cap is not None:
-                table.add_row("Market Cap", format_currency(data.market_cap))
-            if data.pe_ratio is not None:
-                table.add_row("P/E Ratio", f"{data.pe_ratio:.2f}")
-            if data.dividend_yield is not None:
-                table.add_row("Dividend Yield", format_percentage(data.dividend_yield))
-            if data.face_value is not None:
-                table.add_row("Face Value", format_currency(data.face_value))
-            if data.issued_size is not None:
-                table.add_row("Issued Size", f"{data.issued_size:,}")
-        
-        # Trading Information
-        if data.is_fno is not None or data.is_slb is not None:
-            table.add_row("", "")
-            table.add_row("🔄 TRADING INFO", "")
-            table.add_row("", "")
-            if data.is_fno is not None:
-                table.add_row("F&O Available", "Yes" if data.is_fno else "No")
-            if data.is_slb is not None:
-                table.add_row("SLB Available", "Yes" if data.is_slb else "No")
-        
-        # Last Updated
-        if data.last_updated:
-            table.add_row("", "")
-            table.add_row("Last Updated", data.last_updated)
-    
-    def _display_index_data(self, data: IndexData) -> None:
-        """Display index-specific data."""
-        table = self.data_table
-        table.clear()
-        
-        # Index Information
-        if data.index_name:
-            table.add_row("Index Name", data.index_name)
-        table.add_row("Symbol", data.symbol)
-        table.add_row("Type", data.symbol_type.value.upper())
-        
-        # Market Status
-        if data.market_status:
-            table.add_row("Market Status", data.market_status)
-        if data.market_status_message:
-            table.add_row("Status Message", data.market_status_message)
-        
-        # Price Information
-        table.add_row("", "")
-        table.add_row("📊 PRICE INFORMATION", "")
-        table.add_row("", "")
-        if data.current_price is not None:
-            # Current Level with color highlighting for Index
-            current_value = format_currency(data.current_price)
-            if data.previous_close is not None:
-                if data.current_price > data.previous_close:
-                    current_text = Text(current_value, style="bold green")
-                elif data.current_price < data.previous_close:
-                    current_text = Text(current_value, style="bold red")
-                else:
-                    current_text = current_value
-            else:
-                current_text = current_value
-            table.add_row("Current Level", current_text)
-        if data.open_price is not None:
-            table.add_row("Open", format_currency(data.open_price))
-        if data.high_price is not None:
-            table.add_row("Day High", format_currency(data.high_price))
-        if data.low_price is not None:
-            table.add_row("Day Low", format_currency(data.low_price))
-        if data.previous_close is not None:
-            table.add_row("Previous Close", format_currency(data.previous_close))
-        if data.change is not None:
-            table.add_row("Change", format_currency(data.change))
-        if data.change_percent is not None:
-            table.add_row("Change %", format_percentage(data.change_percent))
-        
-        # Year Range
-        if data.year_high or data.year_low:
-            table.add_row("", "")
-            table.add_row("📉 YEAR RANGE", "")
-            table.add_row("", "")
-            if data.year_high is not None:
-                table.add_row("Year High", format_currency(data.year_high))
-            if data.year_low is not None:
-                table.add_row("Year Low", format_currency(data.year_low))
-            if data.near_week_high is not None:
-                table.add_row("Near Week High", f"{data.near_week_high:.2f}%")
-            if data.near_week_low is not None:
-                table.add_row("Near Week Low", f"{data.near_week_low:.2f}%")
-        
-        # Index Composition
-        if data.advances is not None or data.declines is not None:
-            table.add_row("", "")
-            table.add_row("📈 INDEX COMPOSITION", "")
-            table.add_row("", "")
-            if data.advances is not None:
-                table.add_row("Advances", str(data.advances))
-            if data.declines is not None:
-                table.add_row("Declines", str(data.declines))
-            if data.unchanged is not None:
-                table.add_row("Unchanged", str(data.unchanged))
-        
-        # Performance Metrics
-        if data.percent_change_365d or data.percent_change_30d:
-            table.add_row("", "")
-            table.add_row("📊 PERFORMANCE", "")
-            table.add_row("", "")
-            if data.percent_change_365d is not None:
-                table.add_row("1-Year Return", format_percentage(data.percent_change_365d))
-            if data.percent_change_30d is not None:
-                table.add_row("1-Month Return", format_percentage(data.percent_change_30d))
-        
-        # Volume & Market Cap
-        if data.volume or data.value or data.total_market_cap:
-            table.add_row("", "")
-            table.add_row("📈 VOLUME & MARKET CAP", "")
-            table.add_row("", "")
-            if data.volume is not None:
-                table.add_row("Total Volume", f"{data.volume:,}")
-            if data.value is not None:
-                table.add_row("Total Value", format_currency(data.value))
-            if data.total_market_cap is not None:
-                table.add_row("Free Float Mkt Cap", format_currency(data.total_market_cap))
-        
-        # Last Updated
-        if data.last_updated:
-            table.add_row("", "")
-            table.add_row("Last Updated", data.last_updated)
+        # Mount the error message container only when it is needed
+        if self.error_container is not None:
+            return
+        self.error_container = Container(
+            Vertical(
+                Static("⚠️", id="error-icon"),
+                Static("No data found for this symbol", id="error-text"),
+                Static(f"Symbol: {self.symbol}", id="error-symbol"),
+                Static("Please check the symbol name and try again.", id="error-hint"),
+                id="error-content",
+            ),
+            id="error-message-container",
+        )
+        self.main_scroll.mount(self.error_container, before="#detail-button-row")
     
-    def _display_etf_data(self, data: ETFData) -> None:
-        """Display ETF-specific data."""
+    def _show_rows(self, rows: list) -> None:
+        """Show rows, updating only changed values when the field layout is unchanged."""
         table = self.data_table
-        table.clear()
-        
-        # ETF Information
-        if data.company_name:
-            table.add_row("ETF Name", data.company_name)
-        table.add_row("Symbol", data.symbol)
-        table.add_row("Type", data.symbol_type.value.upper())
-        if data.isin:
-            table.add_row("ISIN", data.isin)
-        if data.industry:
-            table.add_row("Industry", data.industry)
-        if data.sector:
-            table.add_row("Sector", data.sector)
-        if data.underlying_index:
-            table.add_row("Underlying Index", data.underlying_index)
-        if data.listing_date:
-            table.add_row("Listing Date", data.listing_date)
-        
-        # Price Information
-        table.add_row("", "")
-        table.add_row("📊 PRICE INFORMATION", "")
-        table.add_row("", "")
-        if data.current_price is not None:
-            table.add_row("Current Price", format_currency(data.current_price))
-        if data.open_price is not None:
-            table.add_row("Open Price", format_currency(data.open_price))
-        
-        # Close Price with color highlighting for ETF
-        if data.close_price is not None:
-            close_value = format_currency(data.close_price)
-            # Color highlight based on comparison with previous close
-            if data.previous_close is not None:
-                if data.close_price > data.previous_close:
-                    close_text = Text(close_value, style="bold green")
-                elif data.close_price < data.previous_close:
-                    close_text = Text(close_value, style="bold red")
-                else:
-                    close_text = close_value  # No highlight when equal
+        labels = [label for label, _ in rows]
+        # One repaint for the whole update, with no empty frame between clear and refill
+        with self.app.batch_update():
+            if labels == self._row_labels:
+                for row_key, (_, value), old_value in zip(self._row_keys, rows, self._row_values):
+                    if value != old_value:
+                        table.update_cell(row_key, "value", value)
             else:
-                close_text = close_value  # No highlight if no previous close
-            table.add_row("Close Price", close_text)
-        
-        if data.high_price is not None:
-            table.add_row("Day High", format_currency(data.high_price))
-        if data.low_price is not None:
-            table.add_row("Day Low", format_currency(data.low_price))
-        if data.previous_close is not None:
-            table.add_row("Previous Close", format_currency(data.previous_close))
-        if data.vwap is not None:
-            table.add_row("VWAP", format_currency(data.vwap))
-        if data.change is not None:
-            table.add_row("Change", format_currency(data.change))
-        if data.change_percent is not None:
-            table.add_row("Change %", format_percentage(data.change_percent))
-        
-        # NAV & Premium/Discount
-        if data.nav or data.premium_discount:
-            table.add_row("", "")
-            table.add_row("💰 NAV & PREMIUM/DISCOUNT", "")
-            table.add_row("", "")
-            if data.nav is not None:
-                table.add_row("NAV", format_currency(data.nav))
-            if data.premium_discount is not None:
-                # Color highlight premium based on value (same as watchlist_view.py)
-                premium_str = format_percentage(data.premium_discount)
-                abs_premium = abs(data.premium_discount)
-                if abs_premium > 10:
-                    premium_text = Text(premium_str, style="bold red")
-                elif abs_premium >= 5:
-                    premium_text = Text(premium_str, style="bold yellow")
-                else:
-                    premium_text = Text(premium_str, style="bold green")
-                table.add_row("Premium/Discount", premium_text)
-        
-        # Circuit Limits & Range
-        if data.lower_circuit or data.upper_circuit or data.week_high or data.week_low:
-            table.add_row("", "")
-            table.add_row("📉 LIMITS & RANGE", "")
-            table.add_row("", "")
-            if data.lower_circuit is not None:
-                table.add_row("Lower Circuit", format_currency(data.lower_circuit))
-            if data.upper_circuit is not None:
-                table.add_row("Upper Circuit", format_currency(data.upper_circuit))
-            if data.price_band_percent:
-                table.add_row("Price Band", f"{data.price_band_percent}%")
-            if data.week_high is not None:
-                week_high_str = format_currency(data.week_high)
-                if data.week_high_date:
-                    week_high_str += f" ({data.week_high_date})"
-                table.add_row("52-Week High", week_high_str)
-            if data.week_low is not None:
-                week_low_str = format_currency(data.week_low)
-                if data.week_low_date:
-                    week_low_str += f" ({data.week_low_date})"
-                table.add_row("52-Week Low", week_low_str)
-        
-        # Volume & Liquidity
-        if data.volume or data.value or data.total_buy_quantity or data.total_sell_quantity:
-            table.add_row("", "")
-            table.add_row("📈 VOLUME & LIQUIDITY", "")
-            table.add_row("", "")
-            if data.volume is not None:
-                table.add_row("Volume", f"{data.volume:,}")
-            if data.value is not None:
-                table.add_row("Value", format_currency(data.value))
-            if data.total_buy_quantity is not None:
-                table.add_row("Total Buy Qty", f"{data.total_buy_quantity:,}")
-            if data.total_sell_quantity is not None:
-                table.add_row("Total Sell Qty", f"{data.total_sell_quantity:,}")
-        
-        # ETF Details
-        if data.face_value or data.issued_size or data.tick_size:
-            table.add_row("", "")
-            table.add_row("📊 ETF DETAILS", "")
-            table.add_row("", "")
-
-            if data.face_value is not None and isinstance(data.face_value, (int, float)):
-                table.add_row("Face Value", format_currency(data.face_value))
-            if data.issued_size is not None and isinstance(data.face_value, (int, float)):
-                table.add_row("Issued Size", f"{data.issued_size:,} units")
-            if data.tick_size is not None and isinstance(data.face_value, (int, float)):
-                table.add_row("Tick Size", format_currency(data.tick_size))
-        
-        # Trading Information
-        if data.is_fno is not None or data.is_slb is not None:
-            table.add_row("", "")
-            table.add_row("🔄 TRADING INFO", "")
-            table.add_row("", "")
-            if data.is_fno is not None:
-                table.add_row("F&O Available", "Yes" if data.is_fno else "No")
-            if data.is_slb is not None:
-                table.add_row("SLB Available", "Yes" if data.is_slb else "No")
-            if data.is_etf_sec is not None:
-                table.add_row("ETF Security", "Yes" if data.is_etf_sec else "No")
-        
-        # Last Updated
-        if data.last_updated:
-            table.add_row("", "")
-            table.add_row("Last Updated", data.last_updated)
-    
-    def _display_mutual_fund_data(self, data: MutualFundData) -> None:
-        """Display mutual fund-specific data."""
-        table = self.data_table
-        table.clear()
-        
-        # Fund Information
-        if data.scheme_name:
-            table.add_row("Scheme Name", data.scheme_name)
-        table.add_row("Scheme Code", data.symbol)
-        table.add_row("Type", data.symbol_type.value.upper())
-        if data.fund_house:
-            table.add_row("Fund House", data.fund_house)
-        if data.scheme_type:
-            table.add_row("Scheme Type", data.scheme_type)
-        if data.scheme_category:
-            table.add_row("Category", data.scheme_category)
-        
-        # NAV Information
-        table.add_row("", "")
-        table.add_row("💰 NAV INFORMATION", "")
-        table.add_row("", "")
-        if data.nav is not None:
-            table.add_row("Current NAV", format_currency(data.nav))
-        
-        # Performance
-        if data.returns_1y or data.returns_3y or data.returns_5y:
-            table.add_row("", "")
-            table.add_row("📊 RETURNS", "")
-            table.add_row("", "")
-            if data.returns_1y is not None:
-                table.add_row("1-Year Return", format_percentage(data.returns_1y))
-            if data.returns_3y is not None:
-                table.add_row("3-Year Return", format_percentage(data.returns_3y))
-            if data.returns_5y is not None:
-                table.add_row("5-Year Return", format_percentage(data.returns_5y))
-        
-        # Fund Details
-        if data.aum or data.expense_ratio:
-            table.add_row("", "")
-            table.add_row("📈 FUND DETAILS", "")
-            table.add_row("", "")
-            if data.aum is not None:
-                table.add_row("AUM", format_currency(data.aum))
-            if data.expense_ratio is not None:
-                table.add_row("Expense Ratio", f"{data.expense_ratio:.2f}%")
-        
-        # Last Updated
-        if data.last_updated:
-            table.add_row("", "")
-            table.add_row("Last Updated", data.last_updated)
+                table.clear()
+                self._row_keys = table.add_rows(rows)
+                self._row_labels = labels
+        self._row_values = [value for _, value in rows]
     
-    def _display_generic_data(self, data: MarketData) -> None:
-        """Display generic market data (fallback)."""
-        table = self.data_table
-        table.clear()
-        
-        # Basic Information
-        table.add_row("Symbol", data.symbol)
-        table.add_row("Type", data.symbol_type.value.upper())
-        
-        # Price Information
-        if data.current_price or data.open_price or data.high_price or data.low_price:
-            table.add_row("", "")
-            table.add_row("📊 PRICE INFORMATION", "")
-            table.add_row("", "")
-            if data.current_price is not None:
-                table.add_row("Current Price", format_currency(data.current_price))
-            if data.open_price is not None:
-                table.add_row("Open Price", format_currency(data.open_price))
-            if data.high_price is not None:
-                table.add_row("High", format_currency(data.high_price))
-            if data.low_price is not None:
-                table.add_row("Low", format_currency(data.low_price))
-            if data.previous_close is not None:
-                table.add_row("Previous Close", format_currency(data.previous_close))
-            if data.change is not None:
-                table.add_row("Change", format_currency(data.change))
-            if data.change_percent is not None:
-                table.add_row("Change %", format_percentage(data.change_percent))
-        
-        # Volume
-        if data.volume or data.value:
-            table.add_row("", "")
-            table.add_row("📈 VOLUME", "")
-            table.add_row("", "")
-            if data.volume is not None:
-                table.add_row("Volume", f"{data.volume:,}")
-            if data.value is not None:
-                table.add_row("Value", format_currency(data.value))
-        
-        # Last Updated
-        if data.last_updated:
-            table.add_row("", "")
-            table.add_row("Last Updated", data.last_updated)
+    def _render_schema(self, data: MarketData, schema: tuple) -> None:
+        """Render data into the table using a field schema."""
+        rows = self._rows_buf
+        rows.clear()
+        _render_fields(rows, data, schema, self._symbol_type_label)
+        self._show_rows(rows)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events."""
@@ -803,7 +861,7 @@ class SymbolDetailScreen(Screen):
 
     def action_add_to_watchlist(self) -> None:
         """Action to trigger adding a symbol to a watchlist."""
-        self.query_one("#add-watchlist-button").press()
+        self.watchlist_button.press()
 
     def action_pop_screen(self) -> None:
         self.app.pop_screen()
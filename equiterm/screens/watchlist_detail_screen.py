@@ -2,19 +2,48 @@
 Watchlist detail screen showing symbols in a selected watchlist.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, DataTable
 from textual.binding import Binding
-from textual import log, events
+from textual import log, events, work
+from textual.worker import get_current_worker
 from textual.events import Click
 from rich.text import Text
 
+from ..models.watchlist import SYMBOL_TYPE_LABELS, SymbolType
 from ..services.storage import storage
 from ..services.symbol_search import symbol_search_service
-from ..services.data_fetcher import data_fetcher
+from ..services.data_fetcher import data_fetcher, BATCH_SIZE
+from ..services.quote_cache import (
+    OPEN_TTL, TTLCache, etf_quote_cache, ohlc_quote_cache, fetch_through, is_market_open, quote_ttl
+)
+from ..utils.styles import CLOSE_STYLE, PREMIUM_STYLE, format_price
+
+
+# Watchlists this large only keep the rows near the viewport in the table
+VIRTUAL_THRESHOLD = 100
+# Rows materialized beyond the bottom of the viewport
+PAGE_BUFFER = 100
+
+# Seconds a row must stay highlighted before its detail data is prefetched
+PREFETCH_DELAY = 0.3
 
+# Type column labels for the rows that have prices
+_ETF_LABEL = SYMBOL_TYPE_LABELS[SymbolType.ETF]
+_EQUITY_LABEL = SYMBOL_TYPE_LABELS[SymbolType.EQUITY]
+
+# Price cell placeholder
+_DASH = "-"
+
+
+def _fp(x) -> str:
+    """Format a price cell, or a dash when the price is missing."""
+    return format_price(x) if x else _DASH
 
 class WatchlistDetailScreen(Screen):
     """Screen for viewing watchlist contents."""
@@ -27,8 +56,21 @@ class WatchlistDetailScreen(Screen):
     def __init__(self, watchlist_name: str):
         super().__init__()
         self.watchlist_name = watchlist_name
-        self.current_symbols = []
+        self.current_symbols = ()
+        self._by_name = {}  # Symbol name -> Symbol for the name-keyed cache paths
         self.etf_data_cache = {}  # Cache ETF data to avoid redundant API calls
+        self._symbol_table = None
+        self._symbol_scroll = None
+        self._symbol_status = None
+        # Symbols the table was last populated for, and when
+        self._last_populate_token = None
+        self._last_populate_time = 0.0
+        self._built_rows = []  # Every row built so far; the table holds a prefix when virtual
+        self._virtual = False
+        # Symbol name -> (row inputs, built row); only touched on the UI thread,
+        # the worker builds into its own copy and hands it back when done
+        self._row_render_cache = {}
+        self._prefetch_cache = TTLCache(maxsize=64, ttl=quote_ttl)  # Detail data for highlighted rows
     
     def compose(self) -> ComposeResult:
         """Compose the watchlist detail screen."""
@@ -38,7 +80,8 @@ class WatchlistDetailScreen(Screen):
             with Vertical(id="symbol-detail-section"):
                 yield Static("", id="detail-title")
                 with VerticalScroll(id="symbol-scroll", can_focus=True):
-                    yield DataTable(id="symbol-table")
+                    # Keep the Symbol column in view when scrolling the wide table sideways
+                    yield DataTable(id="symbol-table", fixed_columns=1)
                 yield Static("", id="symbol-status")
         
         yield Footer()
@@ -47,6 +90,9 @@ class WatchlistDetailScreen(Screen):
         """Initialize the screen."""
         # Setup symbol table columns with OHLC data, NAV, and ETF Premium
         symbol_table = self.query_one("#symbol-table", DataTable)
+        self._symbol_table = symbol_table
+        self._symbol_scroll = self.query_one("#symbol-scroll", VerticalScroll)
+        self._symbol_status = self.query_one("#symbol-status")
         symbol_table.add_columns(
             "Symbol",
             "Type",
@@ -60,17 +106,28 @@ class WatchlistDetailScreen(Screen):
             "ETF Premium"
         )
         symbol_table.cursor_type = "row"
+        self.watch(symbol_table, "scroll_y", self._on_table_scroll, init=False)
+        self.watch(self._symbol_scroll, "scroll_y", self._on_table_scroll, init=False)
         
-        # Load watchlist data
+        # Load watchlist data; rows are filled in by a worker
         self._load_watchlist_data()
-        
-        # Focus the table after loading
-        self.call_after_refresh(self._focus_table)
+    
+    def on_screen_resume(self) -> None:
+        """Reload when coming back to this screen, e.g. from a symbol's detail screen."""
+        # Quotes go stale quickly while the market is open
+        if is_market_open() and time.monotonic() - self._last_populate_time > OPEN_TTL:
+            self._last_populate_token = None
+        self._load_watchlist_data()
+    
+    def on_unmount(self) -> None:
+        """Cancel in-flight fetches when the screen is closed."""
+        self.workers.cancel_group(self, "symbols")
+        self.workers.cancel_group(self, "prefetch")
     
     def _focus_table(self) -> None:
         """Focus the symbol table."""
         try:
-            table = self.query_one("#symbol-table", DataTable)
+            table = self._symbol_table
             if table and table.row_count > 0:
                 table.focus()
         except Exception as e:
@@ -89,147 +146,267 @@ class WatchlistDetailScreen(Screen):
             title = self.query_one("#detail-title")
             title.update(f"Watchlist: {watchlist.name} ({len(watchlist.symbols)} symbols)")
             
+            # Keep the existing rows if the symbols haven't changed since the last populate
+            token = tuple((s.name, s.symbol_type.value) for s in watchlist.symbols)
+            if token == self._last_populate_token:
+                return
+            
             # Populate symbol table
+            self._last_populate_token = token
+            self._last_populate_time = time.monotonic()
             self._populate_symbol_table(watchlist.symbols)
             
         except Exception as e:
             log(f"Error loading watchlist data: {e}")
+            self._last_populate_token = None
             self._update_status(f"Error loading watchlist: {str(e)}", "symbol")
     
     def _populate_symbol_table(self, symbols) -> None:
-        """Populate the symbol table with watchlist symbols and OHLC data."""
-        table = self.query_one("#symbol-table", DataTable)
+        """Reset the symbol table and fill it from a background worker."""
+        table = self._symbol_table
         table.clear()
         
-        self.current_symbols = symbols
+        self.current_symbols = tuple(symbols)
+        self._by_name = {s.name: s for s in symbols}
         self.etf_data_cache = {}  # Clear cache for new watchlist
+        self._built_rows = []
+        self._virtual = len(symbols) >= VIRTUAL_THRESHOLD
+        
+        # Give the worker its own copy of the cached rows, without symbols no
+        # longer in the watchlist
+        names = {s.name for s in symbols}
+        render_cache = {
+            name: entry for name, entry in self._row_render_cache.items() if name in names
+        }
         
         # Show loading message
         self._update_status("Fetching price data...", "symbol")
         
-        # Separate equity and ETF symbols
-        equity_symbols = [s.name for s in symbols if s.symbol_type.value == 'equity']
-        etf_symbols = [s for s in symbols if s.symbol_type.value == 'etf']
-        
-        # Fetch OHLC data for equity symbols using yfinance
-        equity_ohlc_data = data_fetcher.fetch_ohlc_data(equity_symbols) if equity_symbols else {}
-        
-        # Fetch ETF data using jugaad-data (includes NAV and premium)
-        for etf_symbol in etf_symbols:
-            try:
-                etf_data = data_fetcher.fetch_etf_data(etf_symbol.name)
-                if etf_data:
-                    self.etf_data_cache[etf_symbol.name] = etf_data
-            except Exception as e:
-                log(f"Error fetching ETF data for {etf_symbol.name}: {e}")
+        self._populate_symbol_table_worker(symbols, render_cache)
+    
+    @work(thread=True, exclusive=True, group="symbols")
+    def _populate_symbol_table_worker(self, symbols, render_cache: dict) -> None:
+        """Fetch price data in chunks and stream the rows into the symbol table."""
+        worker = get_current_worker()
+        total = len(symbols)
+        build_etf_row = self._build_etf_row
+        build_equity_row = self._build_equity_row
         
-        for symbol in symbols:
-            # Get display name - use full_name if available, otherwise try search
-            display_name = symbol.full_name if hasattr(symbol, 'full_name') and symbol.full_name else symbol.name
-            if display_name == symbol.name:  # If no full_name, try search
-                try:
-                    results = symbol_search_service.search_symbols(symbol.name, max_results=1)
-                    if results and len(results) > 0:
-                        display_name = results[0]['name']
-                except:
-                    pass
-            
-            # Handle ETFs separately
-            if symbol.symbol_type.value == 'etf' and symbol.name in self.etf_data_cache:
-                etf_data = self.etf_data_cache[symbol.name]
-                
-                # Extract OHLC data from ETF data
-                open_price = etf_data.open_price
-                high_price = etf_data.high_price
-                low_price = etf_data.low_price
-                close_price = etf_data.close_price or etf_data.current_price
-                prev_close = etf_data.previous_close
-                nav = etf_data.nav
-                premium = etf_data.premium_discount
-                
-                # Prepare Close value with color highlighting
-                if close_price and prev_close:
-                    close_str = f"₹{close_price:.2f}"
-                    if close_price > prev_close:
-                        close_text = Text(close_str, style="bold green")
-                    elif close_price < prev_close:
-                        close_text = Text(close_str, style="bold red")
-                    else:
-                        close_text = close_str
-                else:
-                    close_text = "-"
-                
-                # Prepare Premium with color highlighting
-                if premium is not None:
-                    premium_str = f"{premium:.2f}%"
-                    abs_premium = abs(premium)
-                    if abs_premium > 10:
-                        premium_text = Text(premium_str, style="bold red")
-                    elif abs_premium >= 5:
-                        premium_text = Text(premium_str, style="bold yellow")
-                    else:
-                        premium_text = Text(premium_str, style="bold green")
-                else:
-                    premium_text = "N/A"
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Look up names missing from older watchlists while prices are fetched
+                names_future = executor.submit(symbol_search_service.lookup_missing_names, symbols)
+                found_names = None
                 
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{open_price:.2f}" if open_price else "-",
-                    f"₹{high_price:.2f}" if high_price else "-",
-                    f"₹{low_price:.2f}" if low_price else "-",
-                    close_text,
-                    f"₹{prev_close:.2f}" if prev_close else "-",
-                    f"₹{nav:.2f}" if nav else "N/A",
-                    premium_text
-                )
+                for start in range(0, total, BATCH_SIZE):
+                    chunk = symbols[start:start + BATCH_SIZE]
+                    
+                    # Separate equity and ETF symbols in a single pass, keeping each type
+                    # value for the row loop below
+                    equity_symbols, etf_symbols, stypes = [], [], []
+                    for s in chunk:
+                        stype = s.symbol_type.value
+                        stypes.append(stype)
+                        if stype == 'equity':
+                            equity_symbols.append(s.name)
+                        elif stype == 'etf':
+                            etf_symbols.append(s.name)
+                    
+                    # Fetch OHLC data for equity symbols using yfinance, skipping fresh cached
+                    # quotes, concurrently with the ETF fetch below
+                    ohlc_future = None
+                    if equity_symbols:
+                        ohlc_future = executor.submit(
+                            fetch_through, ohlc_quote_cache, equity_symbols, data_fetcher.fetch_ohlc_data
+                        )
+                    
+                    # Fetch ETF data using jugaad-data (includes NAV and premium) in one batch
+                    etf_quotes = {}
+                    if etf_symbols:
+                        etf_quotes = fetch_through(etf_quote_cache, etf_symbols, data_fetcher.fetch_etf_data_batch)
+                    
+                    equity_ohlc_data = {}
+                    if ohlc_future is not None:
+                        try:
+                            equity_ohlc_data = ohlc_future.result()
+                        except Exception as e:
+                            log(f"Error fetching OHLC data: {e}")
+                    
+                    if found_names is None:
+                        found_names = names_future.result()
+                    
+                    rows = []
+                    append = rows.append
+                    for symbol, stype in zip(chunk, stypes):
+                        # Get display name - use full_name if available, otherwise the looked-up name
+                        if not symbol.full_name and symbol.name in found_names:
+                            symbol.full_name = found_names[symbol.name]
+                        display_name = symbol.full_name or symbol.name
+                        
+                        # Handle ETFs separately
+                        if stype == 'etf' and symbol.name in etf_quotes:
+                            row = build_etf_row(symbol, etf_quotes[symbol.name], display_name, render_cache)
+                        
+                        # Handle equities with yfinance data
+                        elif stype == 'equity' and equity_ohlc_data.get(symbol.name):
+                            row = build_equity_row(symbol, equity_ohlc_data[symbol.name], display_name, render_cache)
+                        else:
+                            # No data available (index, mutual fund, or failed fetch)
+                            row = (
+                                symbol.name,
+                                stype.upper(),
+                                display_name,
+                                "-",
+                                "-",
+                                "-",
+                                "-",
+                                "-",
+                                "N/A",
+                                "N/A"
+                            )
+                        append(row)
+                    
+                    if worker.is_cancelled:
+                        return
+                    self.app.call_from_thread(self._add_symbol_rows, rows, etf_quotes, start + len(chunk), total)
             
-            # Handle equities with yfinance data
-            elif symbol.symbol_type.value == 'equity' and symbol.name in equity_ohlc_data and equity_ohlc_data[symbol.name]:
-                data = equity_ohlc_data[symbol.name]
-                
-                # Prepare Close value with color highlighting
-                close_price = data['Close']
-                prev_close = data['Previous Close']
-                close_str = f"₹{close_price}"
-                
-                if close_price > prev_close:
-                    close_text = Text(close_str, style="bold green")
-                elif close_price < prev_close:
-                    close_text = Text(close_str, style="bold red")
-                else:
-                    close_text = close_str
-                
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{data['Open']}",
-                    f"₹{data['High']}",
-                    f"₹{data['Low']}",
-                    close_text,
-                    f"₹{prev_close}",
-                    "N/A",  # NAV - not applicable for equity
-                    "N/A"   # Premium - not applicable for equity
-                )
-            else:
-                # No data available (index, mutual fund, or failed fetch)
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "N/A",
-                    "N/A"
-                )
+            if total == 0 and not worker.is_cancelled:
+                self.app.call_from_thread(self._add_symbol_rows, [], {}, 0, 0)
+            
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._on_rows_built, render_cache)
         
-        status = f"Loaded {len(symbols)} symbol(s). Press Enter to view details. Press Q/Escape to go back."
-        self._update_status(status, "symbol")
+        except Exception as e:
+            log(f"Error populating symbol table: {e}")
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._on_populate_error, e)
+    
+    def _on_rows_built(self, render_cache: dict) -> None:
+        """Keep the rows built by a finished populate for the next one to reuse."""
+        self._row_render_cache = render_cache
+    
+    def _on_populate_error(self, error: Exception) -> None:
+        """Report a failed populate and let the next resume retry it."""
+        self._last_populate_token = None
+        self._update_status(f"Error loading prices: {str(error)}", "symbol")
+    
+    def _build_etf_row(self, symbol, etf_data, display_name: str, render_cache: dict) -> tuple:
+        """Build an ETF row, reusing the row in render_cache if its values are unchanged."""
+        key = (
+            display_name, etf_data.open_price, etf_data.high_price, etf_data.low_price,
+            etf_data.close_price, etf_data.current_price, etf_data.previous_close,
+            etf_data.nav, etf_data.premium_discount,
+        )
+        cached = render_cache.get(symbol.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # Extract OHLC data from ETF data
+        open_price = etf_data.open_price
+        high_price = etf_data.high_price
+        low_price = etf_data.low_price
+        close_price = etf_data.close_price or etf_data.current_price
+        prev_close = etf_data.previous_close
+        nav = etf_data.nav
+        premium = etf_data.premium_discount
+        
+        # Prepare Close value with color highlighting
+        if close_price and prev_close:
+            close_str = format_price(close_price)
+            style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+            close_text = Text(close_str, style=style) if style else close_str
+        else:
+            close_text = "-"
+        
+        # Prepare Premium with color highlighting
+        if premium is not None:
+            abs_premium = abs(premium)
+            premium_text = Text(f"{premium:.2f}%", style=PREMIUM_STYLE[(abs_premium >= 5) + (abs_premium > 10)])
+        else:
+            premium_text = "N/A"
+        
+        row = (
+            symbol.name,
+            _ETF_LABEL,
+            display_name,
+            _fp(open_price),
+            _fp(high_price),
+            _fp(low_price),
+            close_text,
+            _fp(prev_close),
+            format_price(nav) if nav else "N/A",
+            premium_text
+        )
+        
+        render_cache[symbol.name] = (key, row)
+        return row
+    
+    def _build_equity_row(self, symbol, ohlc, display_name: str, render_cache: dict) -> tuple:
+        """Build an equity row, reusing the row in render_cache if its values are unchanged."""
+        key = (display_name, ohlc['Open'], ohlc['High'], ohlc['Low'], ohlc['Close'], ohlc['Previous Close'])
+        cached = render_cache.get(symbol.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # Prepare Close value with color highlighting
+        close_price = ohlc['Close']
+        prev_close = ohlc['Previous Close']
+        close_str = _fp(close_price)
+        style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+        close_text = Text(close_str, style=style) if style else close_str
+        
+        row = (
+            symbol.name,
+            _EQUITY_LABEL,
+            display_name,
+            _fp(ohlc['Open']),
+            _fp(ohlc['High']),
+            _fp(ohlc['Low']),
+            close_text,
+            _fp(prev_close),
+            "N/A",  # NAV - not applicable for equity
+            "N/A"   # Premium - not applicable for equity
+        )
+        
+        render_cache[symbol.name] = (key, row)
+        return row
+    
+    def _add_symbol_rows(self, rows, etf_quotes, loaded: int, total: int) -> None:
+        """Append a chunk of rows on the UI thread and report progress."""
+        table = self._symbol_table
+        self.etf_data_cache.update(etf_quotes)
+        first_rows = table.row_count == 0 and rows
+        self._built_rows.extend(rows)
+        self._page_in_rows(table)
+        
+        if loaded < total:
+            self._update_status(f"{loaded}/{total} loaded...", "symbol")
+        else:
+            status = f"Loaded {total} symbol(s). Press Enter to view details. Press Q/Escape to go back."
+            self._update_status(status, "symbol")
+        
+        # Rows only arrive after mount, so focus the table once the first ones are in
+        if first_rows:
+            self._focus_table()
+    
+    def _page_in_rows(self, table: DataTable) -> None:
+        """Add built rows to the table; large watchlists only get the viewport plus a buffer."""
+        if self._virtual:
+            # The table grows inside #symbol-scroll, so either of them may be the one scrolling
+            scroll = self._symbol_scroll
+            wanted = int(table.scroll_y + scroll.scroll_y) + scroll.size.height + PAGE_BUFFER
+        else:
+            wanted = len(self._built_rows)
+        
+        rows = self._built_rows[table.row_count:wanted]
+        if rows:
+            with self.app.batch_update():
+                table.add_rows(rows)
+    
+    def _on_table_scroll(self, scroll_y: float) -> None:
+        """Materialize more rows as a large watchlist is scrolled."""
+        if self._virtual:
+            self._page_in_rows(self._symbol_table)
     
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in symbol table."""
@@ -239,14 +416,44 @@ class WatchlistDetailScreen(Screen):
                 symbol = self.current_symbols[row_index]
                 self._navigate_to_symbol(symbol.name)
     
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch detail data for the highlighted symbol before it is opened."""
+        if event.data_table.id == "symbol-table":
+            row_index = event.cursor_row
+            if 0 <= row_index < len(self.current_symbols):
+                symbol_name = self.current_symbols[row_index].name
+                if symbol_name in self.etf_data_cache or self._prefetch_cache.get(symbol_name) is not None:
+                    self.workers.cancel_group(self, "prefetch")
+                else:
+                    self._prefetch_symbol(symbol_name)
+    
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch_symbol(self, symbol_name: str) -> None:
+        """Fetch a symbol's detail data unless the cursor moves on first."""
+        worker = get_current_worker()
+        time.sleep(PREFETCH_DELAY)
+        symbol = self._by_name.get(symbol_name)
+        if worker.is_cancelled or symbol is None:
+            return
+        
+        try:
+            data = data_fetcher.fetch_symbol_data(symbol.name, symbol.symbol_type, symbol.scheme_code)
+            if data is not None:
+                self._prefetch_cache.set(symbol.name, data)
+        except Exception as e:
+            log(f"Error prefetching {symbol.name}: {e}")
+    
     def _navigate_to_symbol(self, symbol_name: str) -> None:
-        """Navigate to symbol detail screen, passing cached ETF data if available."""
+        """Navigate to symbol detail screen, passing cached or prefetched data if available."""
         from .symbol_detail import SymbolDetailScreen
         log(f"Navigating to symbol: {symbol_name}")
         
-        # Pass cached ETF data if available
+        # Pass cached ETF data and prefetched data if available
         cached_data = self.etf_data_cache.get(symbol_name)
-        self.app.push_screen(SymbolDetailScreen(symbol=symbol_name, cached_etf_data=cached_data))
+        prefetched = self._prefetch_cache.get(symbol_name)
+        self.app.push_screen(
+            SymbolDetailScreen(symbol=symbol_name, cached_etf_data=cached_data, cached_data=prefetched)
+        )
     
     def on_key(self, event: events.Key) -> None:
         """Handle key presses for navigation."""
@@ -264,8 +471,7 @@ class WatchlistDetailScreen(Screen):
     
     def _update_status(self, message: str, section: str = "symbol") -> None:
         """Update status message."""
-        status = self.query_one("#symbol-status")
-        status.update(message)
+        self._symbol_status.update(message)
     
     def action_pop_screen(self) -> None:
         """Go back to watchlist list screen."""
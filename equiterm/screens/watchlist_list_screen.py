@@ -2,18 +2,52 @@
 Watchlist list screen with favorite watchlist display.
 """
 
+import time
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, DataTable
 from textual.binding import Binding
-from textual import log, events
+from textual import log, events, work
+from textual.worker import get_current_worker
 from textual.events import Click
 from rich.text import Text
 
+from ..models.watchlist import SYMBOL_TYPE_LABELS, SymbolType
 from ..services.storage import storage
 from ..services.symbol_search import symbol_search_service
-from ..services.data_fetcher import data_fetcher
+from ..services.data_fetcher import data_fetcher, BATCH_SIZE
+from ..services.quote_cache import etf_quote_cache, ohlc_quote_cache, fetch_through
+from ..utils.styles import S_GREEN, S_RED, S_YELLOW, CLOSE_STYLE, format_price
+
+
+# Favorite watchlists this large only keep the rows near the viewport in the table
+VIRTUAL_THRESHOLD = 100
+# Rows materialized beyond the bottom of the viewport
+PAGE_BUFFER = 100
+
+# Seconds a watchlist must stay highlighted before its quotes are prefetched
+PREFETCH_DELAY = 0.3
+
+
+@lru_cache(maxsize=4096)
+def _fmt_inr(value) -> str:
+    """Format a price cell, or a dash when the price is missing; prices repeat across renders."""
+    return format_price(value) if value else "-"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_pct(value) -> str:
+    """Format a percentage cell."""
+    return f"{value:.2f}%"
+
+
+def _colored_close(close_str: str, close_price, prev_close):
+    """Colour a close cell green or red against the previous close; unchanged stays plain."""
+    style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+    return Text(close_str, style=style) if style else close_str
 
 
 class WatchlistListScreen(Screen):
@@ -29,6 +63,21 @@ class WatchlistListScreen(Screen):
         super().__init__()
         self.watchlists = []
         self.etf_data_cache = {}  # Cache ETF data to avoid redundant API calls
+        self.show_favorite_watchlist = False  # Flag to control favorite watchlist display
+        self._row_keys = {}  # Watchlist name -> row key in the watchlist table
+        self._favorite_column = None
+        self._favorite_items = []  # Fetched favorite rows; the table holds a formatted prefix
+        self._favorite_virtual = False
+        self._favorite_watchlist = None  # Favorite watchlist shown in the favorite table
+        self._prefetch_name = None  # Watchlist whose quotes were last prefetched
+        # Widgets resolved once in on_mount; favorite ones are set while that section is mounted
+        self._watchlist_table = None
+        self._watchlist_status = None
+        self._favorite_section = None
+        self._favorite_name = None
+        self._favorite_scroll = None
+        self._favorite_table = None
+        self._favorite_status = None
     
     def compose(self) -> ComposeResult:
         """Compose the watchlist list screen."""
@@ -43,56 +92,50 @@ class WatchlistListScreen(Screen):
                         yield DataTable(id="watchlist-table")
                     yield Static("", id="watchlist-status")
                 
-                # Favorite Watchlist View
-                self.show_favorite_watchlist = False  # Flag to control favorite watchlist display
-
-                if self.show_favorite_watchlist:
-                    with Vertical(id="favorite-watchlist-section", display=True):
-                        yield Static("⭐ Favorite Watchlist", id="favorite-title")
-                        yield Static("", id="favorite-watchlist-name")
-                        with VerticalScroll(id="favorite-scroll", can_focus=True):
-                            yield DataTable(id="favorite-table")
-                        yield Static("", id="favorite-status")
+                # Favorite Watchlist View is mounted once a favorite watchlist is loaded
         yield Footer()
     
     def on_mount(self) -> None:
         """Initialize the screen."""
+        self._watchlist_table = watchlist_table = self.query_one("#watchlist-table", DataTable)
+        self._watchlist_status = self.query_one("#watchlist-status", Static)
+        
         # Setup watchlist table columns
-        watchlist_table = self.query_one("#watchlist-table", DataTable)
-        watchlist_table.add_columns("Watchlist Name", "Symbols", "Favorite", "Delete")
+        _, _, self._favorite_column, _ = watchlist_table.add_columns(
+            "Watchlist Name", "Symbols", "Favorite", "Delete"
+        )
         watchlist_table.cursor_type = "cell"  # Enable cell navigation
         
-        # Setup favorite table columns
-        if self.show_favorite_watchlist:
-            favorite_table = self.query_one("#favorite-table", DataTable)
-            favorite_table.add_columns(
-                "Symbol",
-                "Type",
-                "Name",
-                "Open",
-                "High",
-                "Low",
-                "Close",
-                "Prev Close",
-                "NAV",
-                "ETF Premium"
-            )
-            favorite_table.cursor_type = "row"
-        
         # Load watchlists immediately (fast, no API calls)
         self._load_watchlists()
         
         # Focus the watchlist table after loading
         self.call_after_refresh(self._focus_watchlist_table)
         
+        # Import the screens Enter navigates to while the user is still looking at this one
+        self._warm_imports()
+        
         # Load favorite watchlist asynchronously (may involve API calls)
         # // todo: enable if you want to show favorite watchlist on watchlist list screen
-        # self.set_timer(0.2, self._load_favorite_watchlist_async)
+        # self._load_favorite_watchlist_async()
+    
+    @work(thread=True, group="warm_imports")
+    def _warm_imports(self) -> None:
+        """Import navigation target screens so the first navigation does not pay for it."""
+        try:
+            from . import watchlist_detail_screen, symbol_detail
+        except Exception as e:
+            log(f"Error preloading screens: {e}")
+    
+    def on_unmount(self) -> None:
+        """Cancel in-flight fetches when the screen is closed."""
+        self.workers.cancel_group(self, "favorite_load")
+        self.workers.cancel_group(self, "prefetch")
     
     def _focus_watchlist_table(self) -> None:
         """Focus the watchlist table."""
         try:
-            table = self.query_one("#watchlist-table", DataTable)
+            table = self._watchlist_table
             if table and table.row_count > 0:
                 table.focus()
         except Exception as e:
@@ -100,207 +143,291 @@ class WatchlistListScreen(Screen):
     
     def _load_watchlists(self) -> None:
         """Load and display all watchlists."""
-        watchlist_names = storage.list_watchlist_names()
+        # Load full watchlist data with a single read of the storage file
+        all_watchlists = storage.load_all_watchlists()
+        self.app.watchlist_names_cache = set(all_watchlists)
         
-        if not watchlist_names:
+        if not all_watchlists:
             self._update_status("No watchlists found. Create one first!", "watchlist")
             return
         
-        # Load full watchlist data
-        self.watchlists = []
-        for name in watchlist_names:
-            watchlist = storage.load_watchlist(name)
-            if watchlist:
-                self.watchlists.append(watchlist)
+        self.watchlists = list(all_watchlists.values())
         
         # Display in table
         self._display_watchlist_list()
     
+    @work(thread=True, exclusive=True, group="favorite_load")
     def _load_favorite_watchlist_async(self) -> None:
-        """Load and display favorite watchlist asynchronously (may involve API calls)."""
+        """Load and display favorite watchlist in a worker thread (may involve API calls)."""
+        call_from_thread = self.app.call_from_thread
         try:
             favorite_watchlist = storage.get_favorite_watchlist()
+            self._favorite_watchlist = favorite_watchlist
             
             if favorite_watchlist:
-                # Show favorite section
-                self.query_one("#favorite-watchlist-section").display = True
-                
-                # Update watchlist name
-                name_widget = self.query_one("#favorite-watchlist-name")
-                name_widget.update(f"📋 {favorite_watchlist.name}")
-                
-                # Show loading status
-                status_widget = self.query_one("#favorite-status")
-                status_widget.update("Loading price data...")
+                # Show favorite section with its name and a loading status
+                call_from_thread(self._show_favorite_header, favorite_watchlist.name)
                 
                 # Populate favorite table (this may take time due to API calls)
                 self._populate_favorite_table(favorite_watchlist.symbols)
-                
-                # Update status with final count
-                total = len(favorite_watchlist.symbols)
-                status_widget.update(f"{total} symbol(s)")
             else:
                 # Hide favorite section if no favorite
-                self.query_one("#favorite-watchlist-section").display = False
+                call_from_thread(self._remove_favorite_section)
                 
         except Exception as e:
             log(f"Error loading favorite watchlist: {e}")
             # Hide favorite section on error
             try:
-                self.query_one("#favorite-watchlist-section").display = False
+                call_from_thread(self._remove_favorite_section)
             except:
                 pass
     
+    async def _show_favorite_header(self, watchlist_name: str) -> None:
+        """Show the favorite section with the watchlist name and a loading status."""
+        if self._favorite_section is None:
+            await self._mount_favorite_section()
+        self._favorite_name.update(f"📋 {watchlist_name}")
+        self._update_status("Loading price data...", "favorite")
+    
+    async def _mount_favorite_section(self) -> None:
+        """Mount the favorite section below the watchlist list."""
+        self._favorite_name = Static("", id="favorite-watchlist-name")
+        self._favorite_table = favorite_table = DataTable(id="favorite-table")
+        self._favorite_scroll = VerticalScroll(favorite_table, id="favorite-scroll", can_focus=True)
+        self._favorite_status = Static("", id="favorite-status")
+        self._favorite_section = Vertical(
+            Static("⭐ Favorite Watchlist", id="favorite-title"),
+            self._favorite_name,
+            self._favorite_scroll,
+            self._favorite_status,
+            id="favorite-watchlist-section",
+        )
+        
+        # Setup favorite table columns
+        favorite_table.add_columns(
+            "Symbol",
+            "Type",
+            "Name",
+            "Open",
+            "High",
+            "Low",
+            "Close",
+            "Prev Close",
+            "NAV",
+            "ETF Premium"
+        )
+        favorite_table.cursor_type = "row"
+        
+        await self.query_one("#watchlist-container").mount(self._favorite_section)
+        self.watch(favorite_table, "scroll_y", self._on_favorite_scroll, init=False)
+        self.watch(self._favorite_scroll, "scroll_y", self._on_favorite_scroll, init=False)
+    
+    def _remove_favorite_section(self) -> None:
+        """Remove the favorite section when there is no favorite watchlist to show."""
+        if self._favorite_section is not None:
+            self._favorite_section.remove()
+            self._favorite_section = self._favorite_name = self._favorite_scroll = None
+            self._favorite_table = self._favorite_status = None
+            self._favorite_items = []
+            self._favorite_virtual = False
+    
+    def _show_favorite_rows(self, items) -> None:
+        """Replace the favorite table rows and update the symbol count."""
+        if self._favorite_table is None:
+            return
+        self._favorite_items = items
+        self._favorite_virtual = len(items) >= VIRTUAL_THRESHOLD
+        # One refresh for the clear and the new rows
+        with self.app.batch_update():
+            self._favorite_table.clear()
+            self._page_in_favorite_rows()
+        self._update_status(f"{len(items)} symbol(s)", "favorite")
+    
+    def _page_in_favorite_rows(self) -> None:
+        """Format and add favorite rows; large watchlists only get the viewport plus a buffer."""
+        table = self._favorite_table
+        if self._favorite_virtual:
+            # The table grows inside #favorite-scroll, so either of them may be the one scrolling
+            scroll = self._favorite_scroll
+            wanted = int(table.scroll_y + scroll.scroll_y) + scroll.size.height + PAGE_BUFFER
+        else:
+            wanted = len(self._favorite_items)
+        
+        format_row = self._format_favorite_row
+        table.add_rows(format_row(*item) for item in self._favorite_items[table.row_count:wanted])
+    
+    def _on_favorite_scroll(self, scroll_y: float) -> None:
+        """Materialize more rows as a large favorite watchlist is scrolled."""
+        if self._favorite_virtual:
+            self._page_in_favorite_rows()
+    
     def _populate_favorite_table(self, symbols) -> None:
-        """Populate the favorite table with symbol data."""
+        """Fetch favorite symbol data (runs in the load worker); rows are formatted on display."""
         if not self.show_favorite_watchlist:
             return
         
-        table = self.query_one("#favorite-table", DataTable)
-        table.clear()
+        # A toggle starts a new load and cancels this one; stop before each request
+        worker = get_current_worker()
+        items = []
         
-        # Separate equity and ETF symbols
-        equity_symbols = [s.name for s in symbols if s.symbol_type.value == 'equity']
-        etf_symbols = [s for s in symbols if s.symbol_type.value == 'etf']
+        # Look up names missing from older watchlists once, before the row loop
+        name_map = symbol_search_service.lookup_missing_names(symbols)
+        if worker.is_cancelled:
+            return
+        
+        # Separate equity and ETF symbols and resolve display names in a single pass
+        equity_symbols, etf_symbols, display_names = [], [], []
+        for symbol in symbols:
+            symbol_type = symbol.symbol_type
+            if symbol_type is SymbolType.EQUITY:
+                equity_symbols.append(symbol.name)
+            elif symbol_type is SymbolType.ETF:
+                etf_symbols.append(symbol.name)
+            # Use full_name if available, otherwise the looked up name
+            display_names.append(symbol.full_name or name_map.get(symbol.name, symbol.name))
         
-        # Fetch OHLC data for equity symbols using yfinance
-        equity_ohlc_data = data_fetcher.fetch_ohlc_data(equity_symbols) if equity_symbols else {}
+        # Fetch OHLC data for equity symbols using yfinance, reusing quotes still fresh
+        # in the shared cache (e.g. after toggling favorite or visiting the watchlist)
+        equity_ohlc_data = (
+            fetch_through(ohlc_quote_cache, equity_symbols, data_fetcher.fetch_ohlc_data)
+            if equity_symbols else {}
+        )
+        if worker.is_cancelled:
+            return
         
-        # Fetch ETF data using jugaad-data (includes NAV and premium)
-        for etf_symbol in etf_symbols:
+        # Fetch ETF data using jugaad-data (includes NAV and premium) concurrently
+        if etf_symbols:
             try:
-                etf_data = data_fetcher.fetch_etf_data(etf_symbol.name)
-                if etf_data:
-                    self.etf_data_cache[etf_symbol.name] = etf_data
+                etf_data = fetch_through(etf_quote_cache, etf_symbols, data_fetcher.fetch_etf_data_batch)
+                self.etf_data_cache.update(
+                    (name, data) for name, data in etf_data.items() if data is not None
+                )
             except Exception as e:
-                log(f"Error fetching ETF data for {etf_symbol.name}: {e}")
+                log(f"Error fetching ETF data: {e}")
         
-        for symbol in symbols:
-            # Get display name - use full_name if available, otherwise try search
-            display_name = symbol.full_name if hasattr(symbol, 'full_name') and symbol.full_name else symbol.name
-            if display_name == symbol.name:  # If no full_name, try search
-                try:
-                    results = symbol_search_service.search_symbols(symbol.name, max_results=1)
-                    if results and len(results) > 0:
-                        display_name = results[0]['name']
-                except:
-                    pass
-            
-            # Handle ETFs separately
-            if symbol.symbol_type.value == 'etf' and symbol.name in self.etf_data_cache:
-                etf_data = self.etf_data_cache[symbol.name]
-                
-                # Extract OHLC data from ETF data
-                open_price = etf_data.open_price
-                high_price = etf_data.high_price
-                low_price = etf_data.low_price
-                close_price = etf_data.close_price or etf_data.current_price
-                prev_close = etf_data.previous_close
-                nav = etf_data.nav
-                premium = etf_data.premium_discount
-                
-                # Prepare Close value with color highlighting
-                if close_price and prev_close:
-                    close_str = f"₹{close_price:.2f}"
-                    if close_price > prev_close:
-                        close_text = Text(close_str, style="bold green")
-                    elif close_price < prev_close:
-                        close_text = Text(close_str, style="bold red")
-                    else:
-                        close_text = close_str
-                else:
-                    close_text = "-"
-                
-                # Prepare Premium with color highlighting
-                if premium is not None:
-                    premium_str = f"{premium:.2f}%"
-                    abs_premium = abs(premium)
-                    if abs_premium > 10:
-                        premium_text = Text(premium_str, style="bold red")
-                    elif abs_premium >= 5:
-                        premium_text = Text(premium_str, style="bold yellow")
-                    else:
-                        premium_text = Text(premium_str, style="bold green")
-                else:
-                    premium_text = "N/A"
-                
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{open_price:.2f}" if open_price else "-",
-                    f"₹{high_price:.2f}" if high_price else "-",
-                    f"₹{low_price:.2f}" if low_price else "-",
-                    close_text,
-                    f"₹{prev_close:.2f}" if prev_close else "-",
-                    f"₹{nav:.2f}" if nav else "N/A",
-                    premium_text
-                )
-            
-            # Handle equities with yfinance data
-            elif symbol.symbol_type.value == 'equity' and symbol.name in equity_ohlc_data and equity_ohlc_data[symbol.name]:
-                data = equity_ohlc_data[symbol.name]
-                
-                # Prepare Close value with color highlighting
-                close_price = data['Close']
-                prev_close = data['Previous Close']
-                close_str = f"₹{close_price}"
-                
-                if close_price > prev_close:
-                    close_text = Text(close_str, style="bold green")
-                elif close_price < prev_close:
-                    close_text = Text(close_str, style="bold red")
-                else:
-                    close_text = close_str
-                
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{data['Open']}",
-                    f"₹{data['High']}",
-                    f"₹{data['Low']}",
-                    close_text,
-                    f"₹{prev_close}",
-                    "N/A",  # NAV - not applicable for equity
-                    "N/A"   # Premium - not applicable for equity
-                )
+        # Keep raw data only; rows are formatted when they enter the table
+        etf_data_cache = self.etf_data_cache
+        for symbol, display_name in zip(symbols, display_names):
+            symbol_type = symbol.symbol_type
+            if symbol_type is SymbolType.ETF and symbol.name in etf_data_cache:
+                items.append((symbol, display_name, etf_data_cache[symbol.name], None))
+            elif symbol_type is SymbolType.EQUITY and equity_ohlc_data.get(symbol.name):
+                items.append((symbol, display_name, None, equity_ohlc_data[symbol.name]))
             else:
-                # No data available (index, mutual fund, or failed fetch)
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "N/A",
-                    "N/A"
-                )
+                items.append((symbol, display_name, None, None))
+        
+        # A newer load superseded this one; leave the table to it
+        if worker.is_cancelled:
+            return
+        
+        self.app.call_from_thread(self._show_favorite_rows, items)
+    
+    def _format_favorite_row(self, symbol, display_name: str, etf_data, ohlc) -> tuple:
+        """Format one favorite table row from its fetched data."""
+        if etf_data is not None:
+            return self._format_etf_row(symbol, display_name, etf_data)
+        if ohlc:
+            return self._format_equity_row(symbol, display_name, ohlc)
+        
+        # No data available (index, mutual fund, or failed fetch)
+        return (
+            symbol.name,
+            SYMBOL_TYPE_LABELS[symbol.symbol_type],
+            display_name,
+            "-",
+            "-",
+            "-",
+            "-",
+            "-",
+            "N/A",
+            "N/A"
+        )
+    
+    def _format_etf_row(self, symbol, display_name: str, etf_data) -> tuple:
+        """Format an ETF row with NAV and premium."""
+        # Extract OHLC data from ETF data
+        open_price = etf_data.open_price
+        high_price = etf_data.high_price
+        low_price = etf_data.low_price
+        close_price = etf_data.close_price or etf_data.current_price
+        prev_close = etf_data.previous_close
+        nav = etf_data.nav
+        premium = etf_data.premium_discount
+        
+        # Prepare Close value with color highlighting
+        if close_price and prev_close:
+            close_text = _colored_close(_fmt_inr(close_price), close_price, prev_close)
+        else:
+            close_text = "-"
+        
+        # Prepare Premium with color highlighting
+        if premium is not None:
+            premium_str = _fmt_pct(premium)
+            abs_premium = abs(premium)
+            if abs_premium > 10:
+                premium_text = Text(premium_str, style=S_RED)
+            elif abs_premium >= 5:
+                premium_text = Text(premium_str, style=S_YELLOW)
+            else:
+                premium_text = Text(premium_str, style=S_GREEN)
+        else:
+            premium_text = "N/A"
+        
+        return (
+            symbol.name,
+            SYMBOL_TYPE_LABELS[symbol.symbol_type],
+            display_name,
+            _fmt_inr(open_price),
+            _fmt_inr(high_price),
+            _fmt_inr(low_price),
+            close_text,
+            _fmt_inr(prev_close),
+            _fmt_inr(nav) if nav else "N/A",
+            premium_text
+        )
+    
+    def _format_equity_row(self, symbol, display_name: str, data) -> tuple:
+        """Format an equity row from yfinance OHLC data."""
+        # Prepare Close value with color highlighting
+        close_price = data['Close']
+        prev_close = data['Previous Close']
+        close_text = _colored_close(_fmt_inr(close_price), close_price, prev_close)
+        
+        return (
+            symbol.name,
+            SYMBOL_TYPE_LABELS[symbol.symbol_type],
+            display_name,
+            _fmt_inr(data['Open']),
+            _fmt_inr(data['High']),
+            _fmt_inr(data['Low']),
+            close_text,
+            _fmt_inr(prev_close),
+            "N/A",  # NAV - not applicable for equity
+            "N/A"   # Premium - not applicable for equity
+        )
     
     def _display_watchlist_list(self) -> None:
         """Display watchlists in DataTable."""
-        table = self.query_one("#watchlist-table", DataTable)
-        table.clear()
+        table = self._watchlist_table
         
-        for watchlist in self.watchlists:
-            count = len(watchlist.symbols)
-            
-            # Show red heart if favorite, gray heart otherwise
-            heart_icon = "❤️" if watchlist.is_favorite else "🩶"
-            
-            table.add_row(
-                watchlist.name,
-                str(count),
-                heart_icon,
-                "🗑"
-            )
+        rows = [
+            (watchlist.name, str(len(watchlist.symbols)), self._heart_icon(watchlist), "🗑")
+            for watchlist in self.watchlists
+        ]
+        # One refresh for the clear and the new rows
+        with self.app.batch_update():
+            table.clear()
+            row_keys = table.add_rows(rows)
+        self._row_keys = {watchlist.name: row_key for watchlist, row_key in zip(self.watchlists, row_keys)}
         
         status_text = f"Found {len(self.watchlists)} watchlist(s). Navigate with arrows, Enter to select."
         self._update_status(status_text, "watchlist")
     
+    @staticmethod
+    def _heart_icon(watchlist) -> str:
+        """Red heart if favorite, gray heart otherwise."""
+        return "❤️" if watchlist.is_favorite else "🩶"
+    
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle cell selection in watchlist table."""
         if event.data_table.id == "watchlist-table":
@@ -318,11 +445,46 @@ class WatchlistListScreen(Screen):
                 elif col_index == 3:
                     self._delete_watchlist(self.watchlists[row_index])
     
+    def on_data_table_cell_highlighted(self, event: DataTable.CellHighlighted) -> None:
+        """Prefetch quotes for the highlighted watchlist before it is opened."""
+        if event.data_table.id == "watchlist-table":
+            row_index = event.coordinate.row
+            if 0 <= row_index < len(self.watchlists):
+                watchlist = self.watchlists[row_index]
+                # Moving across the columns of the same row does not need another prefetch
+                if watchlist.name != self._prefetch_name:
+                    self._prefetch_name = watchlist.name
+                    self._prefetch_watchlist(watchlist)
+    
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch_watchlist(self, watchlist) -> None:
+        """Warm the shared quote caches with the watchlist's first batch unless the cursor moves on first."""
+        worker = get_current_worker()
+        time.sleep(PREFETCH_DELAY)
+        if worker.is_cancelled:
+            return
+        
+        # The detail screen loads symbols in BATCH_SIZE chunks; the first one is shown first
+        equity_symbols, etf_symbols = [], []
+        for symbol in watchlist.symbols[:BATCH_SIZE]:
+            if symbol.symbol_type is SymbolType.EQUITY:
+                equity_symbols.append(symbol.name)
+            elif symbol.symbol_type is SymbolType.ETF:
+                etf_symbols.append(symbol.name)
+        
+        try:
+            if equity_symbols:
+                fetch_through(ohlc_quote_cache, equity_symbols, data_fetcher.fetch_ohlc_data)
+            if etf_symbols and not worker.is_cancelled:
+                fetch_through(etf_quote_cache, etf_symbols, data_fetcher.fetch_etf_data_batch)
+        except Exception as e:
+            log(f"Error prefetching watchlist {watchlist.name}: {e}")
+    
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in favorite table."""
         if event.data_table.id == "favorite-table":
             # Favorite table - navigate to symbol detail
-            favorite_watchlist = storage.get_favorite_watchlist()
+            favorite_watchlist = self._favorite_watchlist
             if favorite_watchlist:
                 row_index = event.cursor_row
                 if 0 <= row_index < len(favorite_watchlist.symbols):
@@ -332,7 +494,7 @@ class WatchlistListScreen(Screen):
     def action_delete_watchlist(self) -> None:
         """Delete the currently selected watchlist."""
         try:
-            table = self.query_one("#watchlist-table", DataTable)
+            table = self._watchlist_table
             row_index = table.cursor_row
             
             if 0 <= row_index < len(self.watchlists):
@@ -344,23 +506,31 @@ class WatchlistListScreen(Screen):
         """Toggle favorite status of a watchlist."""
         try:
             watchlist_name = watchlist.name
+            self._favorite_watchlist = None
             
             # If already favorite, unfavorite it
             if watchlist.is_favorite:
-                storage.unset_favorite_watchlist(watchlist_name)
+                saved = storage.unset_favorite_watchlist(watchlist_name)
                 log(f"Unfavorited watchlist: {watchlist_name}")
                 self._update_status(f"Removed '{watchlist_name}' from favorites.", "watchlist")
+                favorite_name = None
             else:
                 # Set as favorite (automatically unfavorites others)
-                storage.set_favorite_watchlist(watchlist_name)
+                saved = storage.set_favorite_watchlist(watchlist_name)
                 log(f"Favorited watchlist: {watchlist_name}")
                 self._update_status(f"Set '{watchlist_name}' as favorite!", "watchlist")
+                favorite_name = watchlist_name
             
-            # Reload watchlists immediately
-            self._load_watchlists()
+            if saved:
+                # Only the heart icons change; update just those cells
+                self._update_favorite_icons(favorite_name)
+            else:
+                # Storage did not take the change; reload what it has
+                self._load_watchlists()
             
-            # Reload favorite watchlist asynchronously
-            self.set_timer(0.1, self._load_favorite_watchlist_async)
+            # Reload favorite watchlist in the background, replacing any load in flight
+            if self.show_favorite_watchlist:
+                self._load_favorite_watchlist_async()
             
             # Focus the watchlist table after refresh
             self.call_after_refresh(self._focus_watchlist_table)
@@ -369,6 +539,17 @@ class WatchlistListScreen(Screen):
             log(f"Error toggling favorite: {e}")
             self._update_status(f"Failed to toggle favorite: {str(e)}", "watchlist")
     
+    def _update_favorite_icons(self, favorite_name) -> None:
+        """Mark favorite_name (or none) as the favorite, updating only changed heart cells."""
+        table = self._watchlist_table
+        for watchlist in self.watchlists:
+            is_favorite = watchlist.name == favorite_name
+            if watchlist.is_favorite != is_favorite:
+                watchlist.is_favorite = is_favorite
+                table.update_cell(
+                    self._row_keys[watchlist.name], self._favorite_column, self._heart_icon(watchlist)
+                )
+    
     def _delete_watchlist(self, watchlist) -> None:
         """Delete the specified watchlist."""
         try:
@@ -376,20 +557,32 @@ class WatchlistListScreen(Screen):
             
             # Delete from storage
             storage.delete_watchlist(watchlist_name)
+            self.app.watchlist_names_cache = None
+            was_favorite = watchlist.is_favorite or (
+                self._favorite_watchlist is not None and self._favorite_watchlist.name == watchlist_name
+            )
+            if was_favorite:
+                self._favorite_watchlist = None
+                self._remove_favorite_section()
+                # Replace any favorite load in flight, which would show it again
+                if self.show_favorite_watchlist:
+                    self._load_favorite_watchlist_async()
             
             # Remove from local list
             self.watchlists = [w for w in self.watchlists if w.name != watchlist_name]
             
-            # Refresh the display
+            # Remove just its row
+            table = self._watchlist_table
+            row_key = self._row_keys.pop(watchlist_name, None)
+            if row_key is not None:
+                table.remove_row(row_key)
+            
             if len(self.watchlists) > 0:
-                self._display_watchlist_list()
                 self._update_status(f"Deleted watchlist '{watchlist_name}'. {len(self.watchlists)} remaining.", "watchlist")
                 # Focus the watchlist table after deletion
                 self.call_after_refresh(self._focus_watchlist_table)
             else:
                 # No watchlists left
-                table = self.query_one("#watchlist-table", DataTable)
-                table.clear()
                 self._update_status("No watchlists found. Create one first!", "watchlist")
             
             log(f"Deleted watchlist: {watchlist_name}")
@@ -423,15 +616,11 @@ class WatchlistListScreen(Screen):
         
         # Handle navigation between watchlist table and favorite table
         try:
-            watchlist_table = self.query_one("#watchlist-table", DataTable)
-            if self.show_favorite_watchlist:
-                favorite_table = self.query_one("#favorite-table", DataTable)
-            else:
-                return
-            favorite_section = self.query_one("#favorite-watchlist-section")
+            watchlist_table = self._watchlist_table
+            favorite_table = self._favorite_table
             
-            # Only allow navigation if favorite section is visible
-            if not favorite_section.display:
+            # Only allow navigation if favorite section is mounted
+            if favorite_table is None:
                 return
             
             # Down arrow: Move from watchlist table to favorite table
@@ -454,18 +643,21 @@ class WatchlistListScreen(Screen):
     
     def on_click(self, event: Click) -> None:
         """Handle mouse clicks to focus widgets."""
-        widget = self.get_widget_at(event.x, event.y)[0]
-        
-        # Focus clickable widgets
-        if isinstance(widget, DataTable):
-            widget.focus()
+        # Only the two tables are focused on click; check their regions rather than
+        # hit-testing the whole widget tree
+        x, y = event.screen_x, event.screen_y
+        for table in (self._watchlist_table, self._favorite_table):
+            if table is not None and table.region.contains(x, y):
+                if table is not self.focused:
+                    table.focus()
+                return
     
     def _update_status(self, message: str, section: str = "watchlist") -> None:
         """Update status message."""
         if section == "watchlist":
-            status = self.query_one("#watchlist-status")
+            status = self._watchlist_status
         else:
-            status = self.query_one("#favorite-status")
+            status = self._favorite_status
         
         status.update(message)
     
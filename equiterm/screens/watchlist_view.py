@@ -2,18 +2,28 @@
 Watchlist view screen with list selection and symbol navigation.
 """
 
+import time
+
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll, Horizontal
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListItem, ListView, DataTable, Button
 from textual.binding import Binding
-from textual import log, events
+from textual import log, events, work
+from textual.worker import get_current_worker
 from textual.events import Click
 from rich.text import Text
 
+from ..models.watchlist import SYMBOL_TYPE_LABELS, SymbolType
 from ..services.storage import storage
 from ..services.symbol_search import symbol_search_service
 from ..services.data_fetcher import data_fetcher
+from ..services.quote_cache import ohlc_quote_cache, fetch_through, quote_ttl
+from ..utils.styles import S_GREEN, S_RED, S_YELLOW, CLOSE_STYLE, format_price
+
+
+# Symbol rows added per event loop turn; the first chunk is added at once
+SYMBOL_CHUNK_SIZE = 50
 
 
 class WatchlistViewScreen(Screen):
@@ -32,6 +42,27 @@ class WatchlistViewScreen(Screen):
         self.current_symbols = []
         self.view_mode = "list"  # "list" or "detail"
         self.etf_data_cache = {}  # Cache ETF data to avoid redundant API calls
+        self._name_cache = {}  # Searched display names, including misses, by symbol
+        self._row_keys = {}  # Watchlist name -> row key in the watchlist table
+        self._symbol_column_keys = []
+        self._symbol_row_keys = []  # Symbol table row keys, in current_symbols order
+        self._symbol_rows = []  # Cells for every symbol, including rows not added yet
+        self._symbol_generation = 0  # Bumped whenever the symbol table is repopulated or left
+        self._last_populated_key = None  # (watchlist name, symbol names) of the fully loaded table
+        self._populated_until = 0.0  # When the loaded prices stop being fresh
+        
+        # Widget handles, cached in on_mount
+        self._watchlist_table = None
+        self._watchlist_status = None
+        self._list_section = None
+        self._favorite_section = None
+        self._favorite_name = None
+        self._favorite_table = None
+        self._favorite_status = None
+        self._detail_section = None
+        self._detail_title = None
+        self._symbol_table = None
+        self._symbol_status = None
     
     def compose(self) -> ComposeResult:
         """Compose the watchlist view screen."""
@@ -65,14 +96,27 @@ class WatchlistViewScreen(Screen):
     
     def on_mount(self) -> None:
         """Initialize the screen."""
+        # Cache widget handles instead of querying the DOM on every action
+        self._watchlist_table = self.query_one("#watchlist-table", DataTable)
+        self._watchlist_status = self.query_one("#watchlist-status", Static)
+        self._list_section = self.query_one("#watchlist-list-section", Vertical)
+        self._favorite_section = self.query_one("#favorite-watchlist-section", Vertical)
+        self._favorite_name = self.query_one("#favorite-watchlist-name", Static)
+        self._favorite_table = self.query_one("#favorite-table", DataTable)
+        self._favorite_status = self.query_one("#favorite-status", Static)
+        self._detail_section = self.query_one("#symbol-detail-section", Vertical)
+        self._detail_title = self.query_one("#detail-title", Static)
+        self._symbol_table = self.query_one("#symbol-table", DataTable)
+        self._symbol_status = self.query_one("#symbol-status", Static)
+        
         # Setup watchlist table columns
-        watchlist_table = self.query_one("#watchlist-table", DataTable)
+        watchlist_table = self._watchlist_table
         watchlist_table.add_columns("Watchlist Name", "Symbols", "Favorite", "Delete")
         watchlist_table.cursor_type = "cell"  # Enable cell navigation
         
         # Setup symbol table columns with OHLC data, NAV, and ETF Premium
-        symbol_table = self.query_one("#symbol-table", DataTable)
-        symbol_table.add_columns(
+        symbol_table = self._symbol_table
+        self._symbol_column_keys = symbol_table.add_columns(
             "Symbol",
             "Type",
             "Name",  # Full name column - will not be truncated
@@ -87,7 +131,7 @@ class WatchlistViewScreen(Screen):
         symbol_table.cursor_type = "row"
         
         # Setup favorite table columns
-        favorite_table = self.query_one("#favorite-table", DataTable)
+        favorite_table = self._favorite_table
         favorite_table.add_columns(
             "Symbol",
             "Type",
@@ -103,7 +147,7 @@ class WatchlistViewScreen(Screen):
         favorite_table.cursor_type = "row"
         
         # Hide detail section initially
-        self.query_one("#symbol-detail-section").display = False
+        self._detail_section.display = False
         
         # Load and display favorite watchlist if it exists
         self._load_favorite_watchlist()
@@ -117,7 +161,7 @@ class WatchlistViewScreen(Screen):
     def _focus_watchlist_table(self) -> None:
         """Focus the watchlist table."""
         try:
-            table = self.query_one("#watchlist-table", DataTable)
+            table = self._watchlist_table
             if table and table.row_count > 0:
                 table.focus()
         except Exception as e:
@@ -126,6 +170,7 @@ class WatchlistViewScreen(Screen):
     def _load_watchlists(self) -> None:
         """Load and display all watchlists."""
         watchlist_names = storage.list_watchlist_names()
+        self.app.watchlist_names_cache = set(watchlist_names)
         
         if not watchlist_names:
             self._update_status("No watchlists found. Create one first!", "watchlist")
@@ -144,17 +189,14 @@ class WatchlistViewScreen(Screen):
     def _load_favorite_watchlist(self) -> None:
         """Load and display favorite watchlist if it exists."""
         try:
-            from ..services.data_fetcher import data_fetcher
-            from ..services.symbol_search import symbol_search_service
-            
             favorite_watchlist = storage.get_favorite_watchlist()
             
             if favorite_watchlist:
                 # Show favorite section
-                self.query_one("#favorite-watchlist-section").display = True
+                self._favorite_section.display = True
                 
                 # Update watchlist name
-                name_widget = self.query_one("#favorite-watchlist-name")
+                name_widget = self._favorite_name
                 name_widget.update(f"📋 {favorite_watchlist.name}")
                 
                 # Populate favorite table
@@ -162,27 +204,23 @@ class WatchlistViewScreen(Screen):
                 
                 # Update status
                 total = len(favorite_watchlist.symbols)
-                status_widget = self.query_one("#favorite-status")
+                status_widget = self._favorite_status
                 status_widget.update(f"{total} symbol(s)")
             else:
                 # Hide favorite section if no favorite
-                self.query_one("#favorite-watchlist-section").display = False
+                self._favorite_section.display = False
                 
         except Exception as e:
             log(f"Error loading favorite watchlist: {e}")
             # Hide favorite section on error
             try:
-                self.query_one("#favorite-watchlist-section").display = False
+                self._favorite_section.display = False
             except:
                 pass
     
     def _populate_favorite_table(self, symbols) -> None:
         """Populate the favorite table with symbol data (same logic as watchlist_view.py)."""
-        from ..services.data_fetcher import data_fetcher
-        from ..services.symbol_search import symbol_search_service
-        
-        table = self.query_one("#favorite-table", DataTable)
-        table.clear()
+        table = self._favorite_table
         
         # Separate equity and ETF symbols
         equity_symbols = [s.name for s in symbols if s.symbol_type.value == 'equity']
@@ -200,16 +238,12 @@ class WatchlistViewScreen(Screen):
             except Exception as e:
                 log(f"Error fetching ETF data for {etf_symbol.name}: {e}")
         
+        # Use full_name if available, otherwise the looked up name
+        display_names = self._display_names(symbols)
+        
+        rows = []
         for symbol in symbols:
-            # Get display name - use full_name if available, otherwise try search
-            display_name = symbol.full_name if hasattr(symbol, 'full_name') and symbol.full_name else symbol.name
-            if display_name == symbol.name:  # If no full_name, try search
-                try:
-                    results = symbol_search_service.search_symbols(symbol.name, max_results=1)
-                    if results and len(results) > 0:
-                        display_name = results[0]['name']
-                except:
-                    pass
+            display_name = display_names[symbol.name]
             
             # Handle ETFs separately
             if symbol.symbol_type.value == 'etf' and symbol.name in self.etf_data_cache:
@@ -226,13 +260,9 @@ class WatchlistViewScreen(Screen):
                 
                 # Prepare Close value with color highlighting
                 if close_price and prev_close:
-                    close_str = f"₹{close_price:.2f}"
-                    if close_price > prev_close:
-                        close_text = Text(close_str, style="bold green")
-                    elif close_price < prev_close:
-                        close_text = Text(close_str, style="bold red")
-                    else:
-                        close_text = close_str
+                    close_str = format_price(close_price)
+                    style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+                    close_text = Text(close_str, style=style) if style else close_str
                 else:
                     close_text = "-"
                 
@@ -241,26 +271,26 @@ class WatchlistViewScreen(Screen):
                     premium_str = f"{premium:.2f}%"
                     abs_premium = abs(premium)
                     if abs_premium > 10:
-                        premium_text = Text(premium_str, style="bold red")
+                        premium_text = Text(premium_str, style=S_RED)
                     elif abs_premium >= 5:
-                        premium_text = Text(premium_str, style="bold yellow")
+                        premium_text = Text(premium_str, style=S_YELLOW)
                     else:
-                        premium_text = Text(premium_str, style="bold green")
+                        premium_text = Text(premium_str, style=S_GREEN)
                 else:
                     premium_text = "N/A"
                 
-                table.add_row(
+                rows.append((
                     symbol.name,
-                    symbol.symbol_type.value.upper(),
+                    SYMBOL_TYPE_LABELS[symbol.symbol_type],
                     display_name,
-                    f"₹{open_price:.2f}" if open_price else "-",
-                    f"₹{high_price:.2f}" if high_price else "-",
-                    f"₹{low_price:.2f}" if low_price else "-",
+                    format_price(open_price) if open_price else "-",
+                    format_price(high_price) if high_price else "-",
+                    format_price(low_price) if low_price else "-",
                     close_text,
-                    f"₹{prev_close:.2f}" if prev_close else "-",
-                    f"₹{nav:.2f}" if nav else "N/A",
+                    format_price(prev_close) if prev_close else "-",
+                    format_price(nav) if nav else "N/A",
                     premium_text
-                )
+                ))
             
             # Handle equities with yfinance data
             elif symbol.symbol_type.value == 'equity' and symbol.name in equity_ohlc_data and equity_ohlc_data[symbol.name]:
@@ -269,32 +299,28 @@ class WatchlistViewScreen(Screen):
                 # Prepare Close value with color highlighting
                 close_price = data['Close']
                 prev_close = data['Previous Close']
-                close_str = f"₹{close_price}"
+                close_str = format_price(close_price)
                 
-                if close_price > prev_close:
-                    close_text = Text(close_str, style="bold green")
-                elif close_price < prev_close:
-                    close_text = Text(close_str, style="bold red")
-                else:
-                    close_text = close_str
+                style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+                close_text = Text(close_str, style=style) if style else close_str
                 
-                table.add_row(
+                rows.append((
                     symbol.name,
-                    symbol.symbol_type.value.upper(),
+                    SYMBOL_TYPE_LABELS[symbol.symbol_type],
                     display_name,
-                    f"₹{data['Open']}",
-                    f"₹{data['High']}",
-                    f"₹{data['Low']}",
+                    format_price(data['Open']),
+                    format_price(data['High']),
+                    format_price(data['Low']),
                     close_text,
-                    f"₹{prev_close}",
+                    format_price(prev_close),
                     "N/A",  # NAV - not applicable for equity
                     "N/A"   # Premium - not applicable for equity
-                )
+                ))
             else:
                 # No data available (index, mutual fund, or failed fetch)
-                table.add_row(
+                rows.append((
                     symbol.name,
-                    symbol.symbol_type.value.upper(),
+                    SYMBOL_TYPE_LABELS[symbol.symbol_type],
                     display_name,
                     "-",
                     "-",
@@ -303,25 +329,33 @@ class WatchlistViewScreen(Screen):
                     "-",
                     "N/A",
                     "N/A"
-                )
+                ))
+        
+        # One refresh for the clear and the new rows
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(rows)
     
     def _display_watchlist_list(self) -> None:
         """Display watchlists in DataTable."""
-        table = self.query_one("#watchlist-table", DataTable)
-        table.clear()
+        table = self._watchlist_table
         
-        for watchlist in self.watchlists:
-            count = len(watchlist.symbols)
-            
-            # Show red heart if favorite, gray heart otherwise
-            heart_icon = "❤️" if watchlist.is_favorite else "🩶"
-            
-            table.add_row(
+        rows = [
+            (
                 watchlist.name,
-                str(count),
-                heart_icon,
+                str(len(watchlist.symbols)),
+                # Show red heart if favorite, gray heart otherwise
+                "❤️" if watchlist.is_favorite else "🩶",
                 "🗑"
             )
+            for watchlist in self.watchlists
+        ]
+        
+        # One refresh for the clear and the new rows
+        with self.app.batch_update():
+            table.clear()
+            row_keys = table.add_rows(rows)
+        self._row_keys = {watchlist.name: row_key for watchlist, row_key in zip(self.watchlists, row_keys)}
         
         status_text = f"Found {len(self.watchlists)} watchlist(s). Navigate with arrows, Enter to select."
         self._update_status(status_text, "watchlist")
@@ -353,7 +387,6 @@ class WatchlistViewScreen(Screen):
                 self._navigate_to_symbol(symbol.name)
         elif event.data_table.id == "favorite-table":
             # Favorite destination - navigate to symbol detail
-            from ..services.storage import storage
             favorite_watchlist = storage.get_favorite_watchlist()
             if favorite_watchlist:
                 row_index = event.cursor_row
@@ -367,7 +400,7 @@ class WatchlistViewScreen(Screen):
             return
         
         try:
-            table = self.query_one("#watchlist-table", DataTable)
+            table = self._watchlist_table
             row_index = table.cursor_row
             
             if 0 <= row_index < len(self.watchlists):
@@ -408,20 +441,24 @@ class WatchlistViewScreen(Screen):
             
             # Delete from storage
             storage.delete_watchlist(watchlist_name)
+            self.app.watchlist_names_cache = None
             
             # Remove from local list
             self.watchlists = [w for w in self.watchlists if w.name != watchlist_name]
+            self._last_populated_key = None
+            
+            # Remove just its row
+            table = self._watchlist_table
+            row_key = self._row_keys.pop(watchlist_name, None)
+            if row_key is not None:
+                table.remove_row(row_key)
             
-            # Refresh the display
             if len(self.watchlists) > 0:
-                self._display_watchlist_list()
                 self._update_status(f"Deleted watchlist '{watchlist_name}'. {len(self.watchlists)} remaining.", "watchlist")
                 # Focus the watchlist table after deletion
                 self.call_after_refresh(self._focus_watchlist_table)
             else:
                 # No watchlists left
-                table = self.query_one("#watchlist-table", DataTable)
-                table.clear()
                 self._update_status("No watchlists found. Create one first!", "watchlist")
             
             log(f"Deleted watchlist: {watchlist_name}")
@@ -435,11 +472,11 @@ class WatchlistViewScreen(Screen):
         self.view_mode = "detail"
         
         # Hide list, show detail
-        self.query_one("#watchlist-list-section").display = False
-        self.query_one("#symbol-detail-section").display = True
+        self._list_section.display = False
+        self._detail_section.display = True
         
         # Update title
-        title = self.query_one("#detail-title")
+        title = self._detail_title
         title.update(f"Watchlist: {watchlist.name} ({len(watchlist.symbols)} symbols)")
         
         # Populate symbol table
@@ -451,12 +488,33 @@ class WatchlistViewScreen(Screen):
     def _focus_table(self) -> None:
         """Focus the symbol table."""
         try:
-            table = self.query_one("#symbol-table", DataTable)
+            table = self._symbol_table
             if table and table.row_count > 0:
                 table.focus()
         except Exception as e:
             log(f"Error focusing table: {e}")
     
+    def _display_names(self, symbols) -> dict:
+        """Return display names by symbol, searching once in a batch for symbols saved without one."""
+        missing = [
+            s.name for s in symbols
+            if not s.full_name and s.name not in self._name_cache
+        ]
+        if missing:
+            try:
+                found = symbol_search_service.search_symbols_batch(missing)
+            except Exception as e:
+                log(f"Error looking up names: {e}")
+                found = {}
+            # Misses are cached too so they are not searched again
+            for name in missing:
+                self._name_cache[name] = found.get(name, name)
+        
+        return {
+            s.name: s.full_name or self._name_cache.get(s.name, s.name)
+            for s in symbols
+        }
+    
     def _get_stock_data(self, symbols):
         """
         Get OHLC and Previous Close data for multiple Indian stocks using yfinance.
@@ -467,141 +525,218 @@ class WatchlistViewScreen(Screen):
         Returns:
         dict: Dictionary with symbols as keys and stock data as values
         """
-        return data_fetcher.fetch_ohlc_data(symbols)
+        # Reuses quotes fetched today by any screen (or a previous run) while still fresh
+        return fetch_through(ohlc_quote_cache, symbols, data_fetcher.fetch_ohlc_data)
     
     def _populate_symbol_table(self, symbols) -> None:
-        """Populate the symbol table with watchlist symbols and OHLC data."""
-        table = self.query_one("#symbol-table", DataTable)
+        """Populate the symbol table with watchlist symbols, then fill in OHLC data in the background."""
+        # Reopening the watchlist just shown keeps its rows while the prices are fresh
+        if (
+            self._symbol_table_key(symbols) == self._last_populated_key
+            and len(self._symbol_row_keys) == len(symbols)
+            and time.monotonic() < self._populated_until
+        ):
+            self.current_symbols = symbols
+            return
+        self._last_populated_key = None
+        
+        table = self._symbol_table
         table.clear()
         
         self.current_symbols = symbols
         self.etf_data_cache = {}  # Clear cache for new watchlist
         
+        # Placeholder prices until the worker fills them in
+        self._symbol_rows = [
+            (
+                symbol.name,
+                SYMBOL_TYPE_LABELS[symbol.symbol_type],
+                symbol.full_name or symbol.name,
+                "-",
+                "-",
+                "-",
+                "-",
+                "-",
+                "N/A",
+                "N/A"
+            )
+            for symbol in symbols
+        ]
+        self._symbol_row_keys = []
+        self._symbol_generation += 1
+        
+        # Add the first screenful now and stream the rest in without blocking input
+        self._append_symbol_rows(self._symbol_generation)
+        
         # Show loading message
         self._update_status("Fetching price data...", "symbol")
         
-        # Separate equity and ETF symbols
-        equity_symbols = [s.name for s in symbols if s.symbol_type.value == 'equity']
-        etf_symbols = [s for s in symbols if s.symbol_type.value == 'etf']
+        self._fetch_prices_worker(symbols, self._symbol_generation)
+    
+    def _symbol_table_key(self, symbols) -> tuple:
+        """Identify the symbol table contents by watchlist name and symbols."""
+        watchlist_name = self.current_watchlist.name if self.current_watchlist else None
+        return watchlist_name, tuple(s.name for s in symbols)
+    
+    def _append_symbol_rows(self, generation: int) -> None:
+        """Add the next chunk of symbol rows, rescheduling until all are added."""
+        # The table was repopulated or left since this chunk was scheduled
+        if generation != self._symbol_generation:
+            return
         
-        # Fetch OHLC data for equity symbols using yfinance
-        equity_ohlc_data = data_fetcher.fetch_ohlc_data(equity_symbols) if equity_symbols else {}
+        start = len(self._symbol_row_keys)
+        chunk = self._symbol_rows[start:start + SYMBOL_CHUNK_SIZE]
+        self._symbol_row_keys.extend(self._symbol_table.add_rows(chunk))
         
-        # Fetch ETF data using jugaad-data (includes NAV and premium)
-        for etf_symbol in etf_symbols:
-            try:
-                etf_data = data_fetcher.fetch_etf_data(etf_symbol.name)
-                if etf_data:
-                    self.etf_data_cache[etf_symbol.name] = etf_data
-            except Exception as e:
-                log(f"Error fetching ETF data for {etf_symbol.name}: {e}")
+        if len(self._symbol_row_keys) < len(self._symbol_rows):
+            self.call_later(self._append_symbol_rows, generation)
+    
+    @work(thread=True, exclusive=True, group="symbol_prices")
+    def _fetch_prices_worker(self, symbols, generation: int) -> None:
+        """Fetch prices and names for the symbol table off the UI thread."""
+        worker = get_current_worker()
+        etf_data_cache = {}
+        rows = []
         
-        for symbol in symbols:
-            # Get display name - use full_name if available, otherwise try search
-            display_name = symbol.full_name if hasattr(symbol, 'full_name') and symbol.full_name else symbol.name
-            if display_name == symbol.name:  # If no full_name, try search
+        try:
+            # Separate equity and ETF symbols
+            equity_symbols = [s.name for s in symbols if s.symbol_type.value == 'equity']
+            etf_symbols = [s for s in symbols if s.symbol_type.value == 'etf']
+            
+            # Fetch OHLC data for equity symbols using yfinance
+            equity_ohlc_data = self._get_stock_data(equity_symbols) if equity_symbols else {}
+            
+            # Fetch ETF data using jugaad-data (includes NAV and premium)
+            for etf_symbol in etf_symbols:
+                if worker.is_cancelled:
+                    return
                 try:
-                    results = symbol_search_service.search_symbols(symbol.name, max_results=1)
-                    if results and len(results) > 0:
-                        display_name = results[0]['name']
-                except:
-                    pass
+                    etf_data = data_fetcher.fetch_etf_data(etf_symbol.name)
+                    if etf_data:
+                        etf_data_cache[etf_symbol.name] = etf_data
+                except Exception as e:
+                    log(f"Error fetching ETF data for {etf_symbol.name}: {e}")
             
-            # Handle ETFs separately
-            if symbol.symbol_type.value == 'etf' and symbol.name in self.etf_data_cache:
-                etf_data = self.etf_data_cache[symbol.name]
+            # Use full_name if available, otherwise the looked up name
+            display_names = self._display_names(symbols)
+            
+            for symbol in symbols:
+                if worker.is_cancelled:
+                    return
                 
-                # Extract OHLC data from ETF data
-                open_price = etf_data.open_price
-                high_price = etf_data.high_price
-                low_price = etf_data.low_price
-                close_price = etf_data.close_price or etf_data.current_price
-                prev_close = etf_data.previous_close
-                nav = etf_data.nav
-                premium = etf_data.premium_discount
+                display_name = display_names[symbol.name]
                 
-                # Prepare Close value with color highlighting
-                if close_price and prev_close:
-                    close_str = f"₹{close_price:.2f}"
-                    if close_price > prev_close:
-                        close_text = Text(close_str, style="bold green")
-                    elif close_price < prev_close:
-                        close_text = Text(close_str, style="bold red")
+                # Handle ETFs separately
+                if symbol.symbol_type.value == 'etf' and symbol.name in etf_data_cache:
+                    etf_data = etf_data_cache[symbol.name]
+                    
+                    # Extract OHLC data from ETF data
+                    open_price = etf_data.open_price
+                    high_price = etf_data.high_price
+                    low_price = etf_data.low_price
+                    close_price = etf_data.close_price or etf_data.current_price
+                    prev_close = etf_data.previous_close
+                    nav = etf_data.nav
+                    premium = etf_data.premium_discount
+                    
+                    # Prepare Close value with color highlighting
+                    if close_price and prev_close:
+                        close_str = format_price(close_price)
+                        style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+                        close_text = Text(close_str, style=style) if style else close_str
                     else:
-                        close_text = close_str
-                else:
-                    close_text = "-"
-                
-                # Prepare Premium with color highlighting (cell background)
-                if premium is not None:
-                    premium_str = f"{premium:.2f}%"
-                    abs_premium = abs(premium)
-                    if abs_premium > 10:
-                        premium_text = Text(premium_str, style="bold red")
-                    elif abs_premium >= 5:
-                        premium_text = Text(premium_str, style="bold yellow")
+                        close_text = "-"
+                    
+                    # Prepare Premium with color highlighting (cell background)
+                    if premium is not None:
+                        premium_str = f"{premium:.2f}%"
+                        abs_premium = abs(premium)
+                        if abs_premium > 10:
+                            premium_text = Text(premium_str, style=S_RED)
+                        elif abs_premium >= 5:
+                            premium_text = Text(premium_str, style=S_YELLOW)
+                        else:
+                            premium_text = Text(premium_str, style=S_GREEN)
                     else:
-                        premium_text = Text(premium_str, style="bold green")
-                else:
-                    premium_text = "N/A"
-                
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{open_price:.2f}" if open_price else "-",
-                    f"₹{high_price:.2f}" if high_price else "-",
-                    f"₹{low_price:.2f}" if low_price else "-",
-                    close_text,
-                    f"₹{prev_close:.2f}" if prev_close else "-",
-                    f"₹{nav:.2f}" if nav else "N/A",
-                    premium_text
-                )
-            
-            # Handle equities with yfinance data
-            elif symbol.symbol_type.value == 'equity' and symbol.name in equity_ohlc_data and equity_ohlc_data[symbol.name]:
-                data = equity_ohlc_data[symbol.name]
+                        premium_text = "N/A"
+                    
+                    rows.append((
+                        display_name,
+                        format_price(open_price) if open_price else "-",
+                        format_price(high_price) if high_price else "-",
+                        format_price(low_price) if low_price else "-",
+                        close_text,
+                        format_price(prev_close) if prev_close else "-",
+                        format_price(nav) if nav else "N/A",
+                        premium_text
+                    ))
                 
-                # Prepare Close value with color highlighting
-                close_price = data['Close']
-                prev_close = data['Previous Close']
-                close_str = f"₹{close_price}"
-                
-                if close_price > prev_close:
-                    close_text = Text(close_str, style="bold green")
-                elif close_price < prev_close:
-                    close_text = Text(close_str, style="bold red")
+                # Handle equities with yfinance data
+                elif symbol.symbol_type.value == 'equity' and symbol.name in equity_ohlc_data and equity_ohlc_data[symbol.name]:
+                    data = equity_ohlc_data[symbol.name]
+                    
+                    # Prepare Close value with color highlighting
+                    close_price = data['Close']
+                    prev_close = data['Previous Close']
+                    close_str = format_price(close_price)
+                    
+                    style = CLOSE_STYLE[(close_price > prev_close) - (close_price < prev_close)]
+                    close_text = Text(close_str, style=style) if style else close_str
+                    
+                    rows.append((
+                        display_name,
+                        format_price(data['Open']),
+                        format_price(data['High']),
+                        format_price(data['Low']),
+                        close_text,
+                        format_price(prev_close),
+                        "N/A",  # NAV - not applicable for equity
+                        "N/A"   # Premium - not applicable for equity
+                    ))
                 else:
-                    close_text = close_str
-                
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    f"₹{data['Open']}",
-                    f"₹{data['High']}",
-                    f"₹{data['Low']}",
-                    close_text,
-                    f"₹{prev_close}",
-                    "N/A",  # NAV - not applicable for equity
-                    "N/A"   # Premium - not applicable for equity
-                )
-            else:
-                # No data available (index, mutual fund, or failed fetch)
-                table.add_row(
-                    symbol.name,
-                    symbol.symbol_type.value.upper(),
-                    display_name,
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "-",
-                    "N/A",
-                    "N/A"
-                )
+                    # No data available (index, mutual fund, or failed fetch)
+                    rows.append((
+                        display_name,
+                        "-",
+                        "-",
+                        "-",
+                        "-",
+                        "-",
+                        "N/A",
+                        "N/A"
+                    ))
+        except Exception as e:
+            log(f"Error fetching watchlist prices: {e}")
+        
+        # The user went back or opened another watchlist meanwhile
+        if worker.is_cancelled:
+            return
+        
+        self.app.call_from_thread(self._apply_price_rows, rows, etf_data_cache, generation)
+    
+    def _apply_price_rows(self, rows, etf_data_cache, generation: int) -> None:
+        """Patch fetched values into the placeholder rows (runs on the UI thread)."""
+        if generation != self._symbol_generation:
+            return
         
-        status = f"Loaded {len(symbols)} symbol(s). Press Enter to view details. Press Q/Escape to go back."
+        table = self._symbol_table
+        self.etf_data_cache.update(etf_data_cache)
+        
+        # Rows not added yet pick up the values when their chunk is appended
+        for index, values in enumerate(rows):
+            self._symbol_rows[index] = self._symbol_rows[index][:2] + values
+        
+        # Name through ETF Premium; the Symbol and Type cells never change
+        value_columns = self._symbol_column_keys[2:]
+        with self.app.batch_update():
+            for row_key, values in zip(self._symbol_row_keys, rows):
+                for column_key, value in zip(value_columns, values):
+                    table.update_cell(row_key, column_key, value, update_width=True)
+        
+        self._last_populated_key = self._symbol_table_key(self.current_symbols)
+        self._populated_until = time.monotonic() + quote_ttl()
+        
+        status = f"Loaded {len(self.current_symbols)} symbol(s). Press Enter to view details. Press Q/Escape to go back."
         self._update_status(status, "symbol")
     
     def _navigate_to_symbol(self, symbol_name: str) -> None:
@@ -635,11 +770,16 @@ class WatchlistViewScreen(Screen):
     
     def on_click(self, event: Click) -> None:
         """Handle mouse clicks to focus widgets."""
-        widget = self.get_widget_at(event.x, event.y)[0]
+        # The clicked widget comes with the event; no need to hit-test the screen again
+        widget = event.widget
+        if widget is None:
+            return
         
-        # Focus clickable widgets
-        if isinstance(widget, (DataTable, Button)):
-            widget.focus()
+        # Focus the nearest clickable widget
+        for node in widget.ancestors_with_self:
+            if isinstance(node, (DataTable, ListView, Button)):
+                node.focus()
+                break
     
     def _back_to_list(self) -> None:
         """Go back to watchlist list view."""
@@ -647,9 +787,13 @@ class WatchlistViewScreen(Screen):
         self.current_watchlist = None
         self.current_symbols = []
         
+        # Drop any price fetch or row chunks still pending for the watchlist being left
+        self.workers.cancel_group(self, "symbol_prices")
+        self._symbol_generation += 1
+        
         # Show list, hide detail
-        self.query_one("#watchlist-list-section").display = True
-        self.query_one("#symbol-detail-section").display = False
+        self._list_section.display = True
+        self._detail_section.display = False
         
         # Focus the watchlist table
         self.call_after_refresh(self._focus_watchlist_table)
@@ -659,11 +803,7 @@ class WatchlistViewScreen(Screen):
     
     def _update_status(self, message: str, section: str = "watchlist") -> None:
         """Update status message."""
-        if section == "watchlist":
-            status = self.query_one("#watchlist-status")
-        else:
-            status = self.query_one("#symbol-status")
-        
+        status = self._watchlist_status if section == "watchlist" else self._symbol_status
         status.update(message)
     
     def action_pop_screen(self) -> None:
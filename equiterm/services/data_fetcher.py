@@ -3,17 +3,68 @@ Data fetching service using jugaad-data and MFAPI.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from jugaad_data.nse import NSELive
-import yfinance as yf
 
 from textual import log
 from ..models.watchlist import (
     MarketData, StockData, IndexData, ETFData, MutualFundData, SymbolType
 )
 from ..utils.calculations import calculate_etf_premium, calculate_change_percent
+from .quote_cache import TTLCache
+
+# Most quotes requested at once by the batch fetchers
+BATCH_SIZE = 20
+
+# Seconds fetch_multiple_symbols waits for all of its symbols
+MULTI_FETCH_TIMEOUT = 20
+
+# Seconds a raw NSE quote is reused, e.g. when an ETF is fetched through the
+# equity path or a symbol is requested again right away
+LIVE_QUOTE_TTL = 15
+
+# MFAPI publishes NAVs once a day
+NAV_TTL = 60 * 60
+
+# Keep-alive pool sizes; pool_maxsize must cover BATCH_SIZE concurrent requests
+# or surplus connections are discarded and every batch pays new TLS handshakes
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Keys of each symbol's fetch_ohlc_data result
+OHLC_FIELDS = ('Open', 'High', 'Low', 'Close', 'Previous Close')
+
+# yfinance, imported on first use by fetch_ohlc_data
+_yf = None
+
+
+def _mount_pooled_adapter(session: requests.Session) -> None:
+    """Give a session a larger keep-alive pool and retries for transient failures."""
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def _get_yf():
+    """Import yfinance on first use; only watchlist OHLC quotes need it."""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
 
 class DataFetcher:
     """Service for fetching market data from various sources."""
@@ -24,11 +75,54 @@ class DataFetcher:
         self.session.headers.update({
             'User-Agent': 'Equiterm/0.1.0'
         })
+        _mount_pooled_adapter(self.session)
+        
+        # NSELive keeps its own session; batch quotes go through it concurrently
+        nse_session = getattr(self.nse, 's', None)
+        if isinstance(nse_session, requests.Session):
+            _mount_pooled_adapter(nse_session)
+        
+        # Raw API responses by symbol or scheme code. Parsed objects are built
+        # fresh on every call and get a shallow copy as raw_data, so callers
+        # cannot change the cached response
+        self._stock_quotes = TTLCache(maxsize=2048, ttl=LIVE_QUOTE_TTL)
+        self._index_quotes = TTLCache(maxsize=256, ttl=LIVE_QUOTE_TTL)
+        self._mfapi_schemes = TTLCache(maxsize=1024, ttl=NAV_TTL)
+    
+    def _stock_quote(self, symbol: str) -> Optional[dict]:
+        """NSE stock quote, reused for LIVE_QUOTE_TTL seconds."""
+        quote = self._stock_quotes.get(symbol)
+        if quote is None:
+            quote = self.nse.stock_quote(symbol)
+            if quote:
+                self._stock_quotes.set(symbol, quote)
+        return quote
+    
+    def _live_index(self, symbol: str) -> Optional[dict]:
+        """NSE live index response, reused for LIVE_QUOTE_TTL seconds."""
+        response = self._index_quotes.get(symbol)
+        if response is None:
+            response = self.nse.live_index(symbol)
+            if response:
+                self._index_quotes.set(symbol, response)
+        return response
+    
+    def _mfapi_scheme(self, scheme_code: str) -> dict:
+        """MFAPI scheme response, reused for NAV_TTL seconds."""
+        data = self._mfapi_schemes.get(scheme_code)
+        if data is None:
+            url = f"https://api.mfapi.in/mf/{scheme_code}"
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            if data.get('data'):
+                self._mfapi_schemes.set(scheme_code, data)
+        return data
     
     def fetch_equity_data(self, symbol: str) -> Optional[StockData]:
         """Fetch equity data using jugaad-data."""
         try:
-            quote = self.nse.stock_quote(symbol)
+            quote = self._stock_quote(symbol)
 
             log(f"PRATIK: Equity Data: {quote}")
             if not quote or 'priceInfo' not in quote:
@@ -99,7 +193,7 @@ class DataFetcher:
                 
                 # Metadata
                 last_updated=metadata.get('lastUpdateTime') or datetime.now().isoformat(),
-                raw_data=quote
+                raw_data=dict(quote)
             )
         except Exception as e:
             log(f"PRATIK: Error fetching equity data: {e}")
@@ -109,7 +203,7 @@ class DataFetcher:
         """Fetch index data using jugaad-data live_index API."""
         try:
             # Use live_index API for comprehensive index data
-            response = self.nse.live_index(symbol)
+            response = self._live_index(symbol)
             log(f"PRATIK: Index Data for symbol {symbol}: {response}")
             
             if not response or 'data' not in response or not response['data']:
@@ -163,7 +257,7 @@ class DataFetcher:
                 
                 # Metadata
                 last_updated=index_data.get('lastUpdateTime') or response.get('timestamp') or datetime.now().isoformat(),
-                raw_data=response
+                raw_data=dict(response)
             )
         except Exception as e:
             log(f"Error fetching index data: {e}")
@@ -173,7 +267,7 @@ class DataFetcher:
         """Fetch ETF data using jugaad-data stock_quote API."""
         try:
             # Fetch ETF data (ETFs trade like stocks but have additional NAV info)
-            quote = stock_quote if stock_quote else self.nse.stock_quote(symbol)
+            quote = stock_quote if stock_quote else self._stock_quote(symbol)
             log(f"PRATIK: ETF Data for symbol {symbol}: {quote}")
             
             if not quote or 'priceInfo' not in quote:
@@ -265,21 +359,43 @@ class DataFetcher:
                 
                 # Metadata
                 last_updated=metadata.get('lastUpdateTime') or datetime.now().isoformat(),
-                raw_data=quote
+                raw_data=dict(quote)
             )
             
         except Exception as e:
             log(f"Error fetching ETF data: {e}")
             return None
     
+    def fetch_etf_data_batch(self, symbols: List[str]) -> Dict[str, ETFData]:
+        """
+        Fetch ETF data for several symbols.
+        
+        NSE has no multi-symbol quote API, so quotes are requested concurrently
+        in groups of at most BATCH_SIZE over the shared NSE session.
+        
+        Parameters:
+        symbols (list): List of ETF symbols (e.g., ['GOLDBEES', 'NIFTYBEES'])
+        
+        Returns:
+        dict: ETFData by symbol; symbols that could not be fetched are omitted
+        """
+        results = {}
+        if not symbols:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(BATCH_SIZE, len(symbols))) as executor:
+            for start in range(0, len(symbols), BATCH_SIZE):
+                chunk = symbols[start:start + BATCH_SIZE]
+                for symbol, etf_data in zip(chunk, executor.map(self.fetch_etf_data, chunk)):
+                    if etf_data:
+                        results[symbol] = etf_data
+        
+        return results
+    
     def fetch_mutual_fund_data(self, scheme_code: str) -> Optional[MutualFundData]:
         """Fetch mutual fund data from MFAPI."""
         try:
-            url = f"https://api.mfapi.in/mf/{scheme_code}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._mfapi_scheme(scheme_code)
             if 'data' not in data or not data['data']:
                 return None
             
@@ -306,7 +422,7 @@ class DataFetcher:
                 
                 # Metadata
                 last_updated=latest_data.get('date') or datetime.now().isoformat(),
-                raw_data=data
+                raw_data=dict(data)
             )
             
         except Exception as e:
@@ -316,11 +432,7 @@ class DataFetcher:
     def _fetch_nav_from_mfapi(self, scheme_code: str) -> Optional[float]:
         """Fetch NAV from MFAPI."""
         try:
-            url = f"https://api.mfapi.in/mf/{scheme_code}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._mfapi_scheme(scheme_code)
             if 'data' in data and data['data']:
                 # Get the latest NAV
                 latest_data = data['data'][0]
@@ -345,18 +457,43 @@ class DataFetcher:
             return None
     
     def fetch_multiple_symbols(self, symbols_data: list) -> Dict[str, MarketData]:
-        """Fetch data for multiple symbols."""
+        """
+        Fetch data for multiple symbols.
+        
+        Each symbol is a separate request, so at most BATCH_SIZE of them are
+        fetched concurrently over the shared sessions. Symbols still pending
+        after MULTI_FETCH_TIMEOUT seconds are left out of the results.
+        """
         results = {}
         
-        for symbol_info in symbols_data:
-            symbol = symbol_info.get('symbol')
-            symbol_type = symbol_info.get('type')
-            scheme_code = symbol_info.get('scheme_code')
-            
-            if symbol:
-                data = self.fetch_symbol_data(symbol, symbol_type, scheme_code)
+        jobs = [
+            (symbol_info.get('symbol'), symbol_info.get('type'), symbol_info.get('scheme_code'))
+            for symbol_info in symbols_data
+            if symbol_info.get('symbol')
+        ]
+        if not jobs:
+            return results
+        
+        executor = ThreadPoolExecutor(max_workers=min(BATCH_SIZE, len(jobs)))
+        futures = {executor.submit(self.fetch_symbol_data, *job): job[0] for job in jobs}
+        try:
+            for future in as_completed(futures, timeout=MULTI_FETCH_TIMEOUT):
+                symbol = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    log(f"Error fetching data for {symbol}: {e}")
+                    continue
                 if data:
                     results[symbol] = data
+        except FuturesTimeoutError:
+            pending = [symbol for future, symbol in futures.items() if not future.done()]
+            log(f"Timed out fetching data for {', '.join(pending)}")
+        finally:
+            # Don't block on requests that are still hanging
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
         
         return results
     
@@ -374,59 +511,49 @@ class DataFetcher:
             return {}
         
         try:
+            yf = _get_yf()
+            # numpy comes with yfinance's pandas, so importing it here costs nothing extra
+            import numpy as np
+            
             # Append .NS to each symbol for NSE
             nse_symbols = [symbol + '.NS' for symbol in symbols]
             
-            # Download data for the last 2 days to get current and previous close
-            data = yf.download(nse_symbols, period='2d', progress=False)
+            # Fetch the last 2 days to get current and previous close as one
+            # (days x symbols) array per field, columns in nse_symbols order
+            fields = ('Open', 'High', 'Low', 'Close')
+            if len(nse_symbols) == 1:
+                # A single ticker needs none of download's threading or column grouping
+                data = yf.Ticker(nse_symbols[0]).history(period='2d', auto_adjust=False)
+                opens, highs, lows, closes = (data[[field]].to_numpy() for field in fields)
+            else:
+                data = yf.download(
+                    nse_symbols, period='2d', progress=False,
+                    group_by='ticker', threads=True, auto_adjust=False
+                )
+                opens, highs, lows, closes = (
+                    data.xs(field, axis=1, level=1).reindex(columns=nse_symbols).to_numpy()
+                    for field in fields
+                )
             
-            result = {}
+            if len(closes) == 0:
+                log(f"Error fetching stock data: no rows for {', '.join(symbols)}")
+                return {symbol: None for symbol in symbols}
             
-            # Handle single stock vs multiple stocks
-            if len(symbols) == 1:
-                symbol = symbols[0]
-                try:
-                    latest_data = data.iloc[-1]  # Latest day
-                    previous_close = data['Close'].iloc[-2] if len(data) >= 2 else data['Close'].iloc[-1]
-                    
-                    result[symbol] = {
-                        'Open': round(latest_data['Open'], 2),
-                        'High': round(latest_data['High'], 2),
-                        'Low': round(latest_data['Low'], 2),
-                        'Close': round(latest_data['Close'], 2),
-                        'Previous Close': round(previous_close, 2)
-                    }
-                except Exception as e:
-                    log(f"Error processing {symbol}: {e}")
+            # Latest OHLC and previous close of every symbol as one (symbols x 5)
+            # array; a missing previous close falls back to the close. Prices are
+            # left unrounded, screens format them to two decimals
+            previous_close = closes[-2] if len(closes) >= 2 else closes[-1]
+            previous_close = np.where(np.isnan(previous_close), closes[-1], previous_close)
+            ohlc = np.column_stack((opens[-1], highs[-1], lows[-1], closes[-1], previous_close))
+            missing = np.isnan(ohlc).any(axis=1)
+            
+            result = {}
+            for symbol, values, no_data in zip(symbols, ohlc.tolist(), missing.tolist()):
+                if no_data:
+                    log(f"Error processing {symbol}: no price data")
                     result[symbol] = None
-            else:
-                # For multiple stocks
-                for symbol in symbols:
-                    try:
-                        nse_symbol = symbol + '.NS'
-                        
-                        # Get latest day data
-                        latest_open = data['Open'][nse_symbol].iloc[-1]
-                        latest_high = data['High'][nse_symbol].iloc[-1]
-                        latest_low = data['Low'][nse_symbol].iloc[-1]
-                        latest_close = data['Close'][nse_symbol].iloc[-1]
-                        
-                        # Get previous close
-                        if len(data) >= 2:
-                            previous_close = data['Close'][nse_symbol].iloc[-2]
-                        else:
-                            previous_close = latest_close
-                        
-                        result[symbol] = {
-                            'Open': round(latest_open, 2),
-                            'High': round(latest_high, 2),
-                            'Low': round(latest_low, 2),
-                            'Close': round(latest_close, 2),
-                            'Previous Close': round(previous_close, 2)
-                        }
-                    except Exception as e:
-                        log(f"Error processing {symbol}: {e}")
-                        result[symbol] = None
+                else:
+                    result[symbol] = dict(zip(OHLC_FIELDS, values))
             
             return result
         except Exception as e:
@@ -0,0 +1,126 @@
+"""
+On-disk cache for historical price data with a time-to-live.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from textual import log
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Daily bars only change once per trading day
+DEFAULT_TTL = 24 * 60 * 60
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".equiterm", "cache", "history")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@lru_cache(maxsize=32)
+def _read_frame(path: str, mtime_ns: int) -> "pd.DataFrame":
+    """Read a cached frame; keyed on mtime so rewritten files are re-read."""
+    # Imported here so importing the cache does not load pandas
+    import pandas as pd
+    return pd.read_pickle(path)
+
+
+class FileCache:
+    """Pickle file cache for DataFrames, one data file plus a .meta.json per key."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL):
+        self.cache_dir = Path(os.path.expanduser(cache_dir))
+        self.ttl = ttl
+
+    def _paths(self, key: Tuple) -> Tuple[Path, Path]:
+        """Return the data and metadata paths for a cache key."""
+        stem = "_".join(_UNSAFE_CHARS.sub("_", str(part)) for part in key)
+        return self.cache_dir / f"{stem}.pkl", self.cache_dir / f"{stem}.meta.json"
+
+    def get(self, key: Tuple) -> Optional["pd.DataFrame"]:
+        """Return the cached DataFrame for key, or None if missing or expired."""
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                fetched_at = json.load(f)['fetched_at']
+            if time.time() - fetched_at > self.ttl:
+                return None
+            return _read_frame(str(data_path), data_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log(f"Error reading history cache for {key}: {e}")
+            return None
+
+    def set(self, key: Tuple, df: "pd.DataFrame") -> bool:
+        """Store df under key; files are written atomically via rename."""
+        data_path, meta_path = self._paths(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(data_path, lambda path: df.to_pickle(path))
+            meta = json.dumps({'fetched_at': time.time()})
+            self._write_atomic(meta_path, lambda path: Path(path).write_text(meta, encoding='utf-8'))
+        except Exception as e:
+            log(f"Error writing history cache for {key}: {e}")
+            return False
+        # Keys include the rolling end date, so older entries would otherwise pile up
+        self.prune()
+        return True
+
+    def prune(self) -> None:
+        """Delete entries older than the TTL, including data files without metadata."""
+        now = time.time()
+        try:
+            data_paths = list(self.cache_dir.glob("*.pkl"))
+        except Exception as e:
+            log(f"Error listing history cache: {e}")
+            return
+        for data_path in data_paths:
+            meta_path = data_path.with_name(f"{data_path.stem}.meta.json")
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    fetched_at = json.load(f)['fetched_at']
+            except FileNotFoundError:
+                # Metadata is written after the data; only drop old orphans
+                try:
+                    fetched_at = data_path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+            except Exception:
+                fetched_at = 0
+            if now - fetched_at > self.ttl:
+                self._unlink(meta_path)
+                self._unlink(data_path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        """Delete a cache file, ignoring one that is already gone."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"Error deleting history cache file {path}: {e}")
+
+    def _write_atomic(self, target: Path, write) -> None:
+        """Write to a temp file in the cache dir, then rename over target."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# Global instance
+history_cache = FileCache()
@@ -0,0 +1,272 @@
+"""
+TTL caches for quotes shared across screens.
+
+Quotes are kept in memory; OHLC quotes are also written as JSON under
+~/.equiterm/cache/quotes/ohlc so they survive a restart.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+from textual import log
+
+
+# NSE trades 09:15-15:30 IST, Monday to Friday
+IST = timezone(timedelta(hours=5, minutes=30))
+MARKET_OPEN = dt_time(9, 15)
+MARKET_CLOSE = dt_time(15, 30)
+
+# Quote freshness while the market is open and in the hour after close,
+# while the closing prices settle
+OPEN_TTL = 60
+CLOSED_TTL = 60 * 60
+SETTLE_UNTIL = dt_time(16, 30)
+
+# Longest freshness once prices have settled; quotes otherwise stay fresh
+# until the next open
+MAX_CLOSED_TTL = 12 * 60 * 60
+
+# Expired quote files are swept from disk at most this often
+PRUNE_INTERVAL = 60 * 60
+
+DEFAULT_QUOTE_DIR = os.path.join("~", ".equiterm", "cache", "quotes")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """Return True during NSE trading hours (holidays are not accounted for)."""
+    now = now or datetime.now(IST)
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() <= MARKET_CLOSE
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """Return the start of the next NSE session (holidays are not accounted for)."""
+    now = now or datetime.now(IST)
+    day = now.date()
+    if now.time() >= MARKET_OPEN:
+        day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN, tzinfo=IST)
+
+
+def trading_day(now: Optional[datetime] = None) -> date:
+    """
+    Return the date of the latest session to have opened, used to key quotes.
+    
+    Quotes fetched over a weekend or before the open share the previous
+    session's key, and the key moves on when the next session opens.
+    """
+    now = now or datetime.now(IST)
+    day = now.date()
+    if now.time() < MARKET_OPEN:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def quote_ttl() -> float:
+    """TTL for a quote fetched now."""
+    now = datetime.now(IST)
+    if is_market_open(now):
+        return OPEN_TTL
+    if now.weekday() < 5 and MARKET_CLOSE < now.time() < SETTLE_UNTIL:
+        return CLOSED_TTL
+    # Nothing changes until the next session opens
+    return min((next_market_open(now) - now).total_seconds(), MAX_CLOSED_TTL)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int = 512, ttl: Union[float, Callable[[], float]] = CLOSED_TTL):
+        """
+        Args:
+            maxsize: Maximum number of entries kept; least recently used are evicted
+            ttl: Seconds an entry stays fresh, or a callable evaluated on each set
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key."""
+        ttl = self.ttl() if callable(self.ttl) else self.ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class PersistentTTLCache(TTLCache):
+    """TTLCache that also writes JSON-serializable entries to disk, so quotes survive restarts."""
+
+    def __init__(self, cache_dir: str, maxsize: int = 512,
+                 ttl: Union[float, Callable[[], float]] = CLOSED_TTL):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.cache_dir = Path(os.path.expanduser(cache_dir))
+        self._next_prune = 0.0
+
+    def _path(self, key: Hashable) -> Path:
+        """Return the file path for a cache key."""
+        parts = key if isinstance(key, tuple) else (key,)
+        stem = "_".join(_UNSAFE_CHARS.sub("_", str(part)) for part in parts)
+        return self.cache_dir / f"{stem}.json"
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value from memory, falling back to disk."""
+        value = super().get(key)
+        if value is not None:
+            return value
+
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log(f"Error reading quote cache for {key}: {e}")
+            return None
+
+        remaining = entry.get('expires_at', 0) - time.time()
+        if remaining <= 0:
+            self._unlink(self._path(key))
+            return None
+
+        # Promote to memory for the rest of its lifetime
+        with self._lock:
+            self._data[key] = (time.monotonic() + remaining, entry['value'])
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return entry['value']
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key in memory and on disk."""
+        # The TTL depends on when the quote was fetched, so its expiry is stored
+        ttl = self.ttl() if callable(self.ttl) else self.ttl
+        super().set(key, value)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({'expires_at': time.time() + ttl, 'value': value})
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            log(f"Error writing quote cache for {key}: {e}")
+
+        # Quotes are keyed by trading day, so older files would otherwise pile up
+        with self._lock:
+            due = time.monotonic() >= self._next_prune
+            if due:
+                self._next_prune = time.monotonic() + PRUNE_INTERVAL
+        if due:
+            self.prune()
+
+    def prune(self) -> None:
+        """Delete expired or unreadable quote files."""
+        now = time.time()
+        try:
+            paths = list(self.cache_dir.glob("*.json"))
+        except Exception as e:
+            log(f"Error listing quote cache: {e}")
+            return
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    expires_at = json.load(f).get('expires_at', 0)
+            except FileNotFoundError:
+                continue
+            except Exception:
+                expires_at = 0
+            if expires_at <= now:
+                self._unlink(path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        """Delete a cache file, ignoring one that is already gone."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"Error deleting quote cache file {path}: {e}")
+
+
+def fetch_through(cache: TTLCache, symbols: List[str],
+                  fetch_many: Callable[[List[str]], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Look symbols up in cache for the current trading day, fetching only the misses.
+
+    Args:
+        cache: Cache keyed by (symbol, trading day)
+        symbols: Symbols to look up
+        fetch_many: Fetches a list of symbols and returns values by symbol
+
+    Returns:
+        Values by symbol; failed fetches are returned as None but not cached
+    """
+    day = trading_day()
+    results = {}
+    missing = []
+    for symbol in symbols:
+        value = cache.get((symbol, day))
+        if value is None:
+            missing.append(symbol)
+        else:
+            results[symbol] = value
+
+    if missing:
+        for symbol, value in fetch_many(missing).items():
+            if value is not None:
+                cache.set((symbol, day), value)
+            results[symbol] = value
+
+    return results
+
+
+# Shared caches
+etf_quote_cache = TTLCache(maxsize=512, ttl=quote_ttl)
+ohlc_quote_cache = PersistentTTLCache(
+    os.path.join(DEFAULT_QUOTE_DIR, "ohlc"), maxsize=512, ttl=quote_ttl
+)
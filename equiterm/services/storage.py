@@ -184,6 +184,18 @@ class JSONStorage(StorageInterface):
         data = self._load_raw_data()
         return list(data.keys())
     
+    def has_any_watchlist(self) -> bool:
+        """Check whether at least one watchlist exists."""
+        try:
+            # A missing file, an empty file or "{}" cannot hold a watchlist
+            if os.path.getsize(self.file_path) <= 2:
+                return False
+        except OSError:
+            return False
+        
+        data = self._load_raw_data()
+        return next(iter(data), None) is not None
+    
     def set_favorite_watchlist(self, name: str) -> bool:
         """
         Set a watchlist as favorite. 
@@ -220,6 +232,28 @@ class JSONStorage(StorageInterface):
         
         data[name]['is_favorite'] = False
         return self._save_raw_data(data)
+    
+    def update_symbol_full_name(self, full_names: Dict[str, str]) -> bool:
+        """
+        Fill in missing full names for symbols across all watchlists.
+        
+        Args:
+            full_names: Dictionary mapping symbol name to full name
+        
+        Returns:
+            True if the file was saved or nothing needed updating
+        """
+        data = self._load_raw_data()
+        
+        changed = False
+        for watchlist_data in data.values():
+            for symbol_data in watchlist_data.get('symbols', []):
+                full_name = full_names.get(symbol_data.get('name'))
+                if full_name and not symbol_data.get('full_name'):
+                    symbol_data['full_name'] = full_name
+                    changed = True
+        
+        return self._save_raw_data(data) if changed else True
 
 
 # Global storage instance
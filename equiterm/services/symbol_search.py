@@ -3,9 +3,13 @@ Symbol search service using NSE autocomplete API.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from textual import log
 
+from ..models.watchlist import SymbolType
+from .storage import storage
+
 
 class SymbolSearchService:
     """Service for searching NSE symbols using autocomplete API."""
@@ -21,6 +25,10 @@ class SymbolSearchService:
             'Accept-Language': 'en-US,en;q=0.9',
         }
         self._initialized = False
+        # Successful results by (query, max_results); names do not change within a session
+        self._results_cache: Dict[tuple, List[Dict[str, str]]] = {}
+        # Name of every symbol seen in a search result, for lookups without a request
+        self._name_by_symbol: Dict[str, str] = {}
     
     def _initialize_session(self) -> None:
         """Initialize session by visiting homepage to get cookies."""
@@ -46,6 +54,11 @@ class SymbolSearchService:
         if not query or len(query.strip()) == 0:
             return []
         
+        cache_key = (query.strip().upper(), max_results)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         # Initialize session if needed
         self._initialize_session()
         
@@ -76,7 +89,10 @@ class SymbolSearchService:
                         })
                 
                 log(f"Found {len(results)} results for query: {query}")
-                return results
+                if results:
+                    self._results_cache[cache_key] = results
+                    self._name_by_symbol.update((r['symbol'].upper(), r['name']) for r in results)
+                return list(results)
             else:
                 log(f"Symbol search error: HTTP {response.status_code}")
                 return []
@@ -84,6 +100,82 @@ class SymbolSearchService:
         except Exception as e:
             log(f"Error searching symbols: {e}")
             return []
+    
+    def get_display_name(self, symbol: str) -> Optional[str]:
+        """Return the name of a symbol already seen in a search result, without a request."""
+        return self._name_by_symbol.get(symbol.strip().upper())
+    
+    def search_symbols_batch(self, queries: List[str], max_workers: int = 8) -> Dict[str, str]:
+        """
+        Look up the display name of several symbols concurrently.
+        
+        Args:
+            queries: Symbols to look up
+            max_workers: Maximum number of concurrent requests (default: 8)
+        
+        Returns:
+            Dictionary mapping each query to the name of the result whose symbol
+            is exactly the query (ignoring case); other queries are omitted
+        """
+        queries = [query for query in dict.fromkeys(queries) if query and query.strip()]
+        
+        # Symbols already seen in earlier results need no request
+        found = {}
+        for query in queries:
+            name = self.get_display_name(query)
+            if name:
+                found[query] = name
+        queries = [query for query in queries if query not in found]
+        if not queries:
+            return found
+        
+        # Get cookies once instead of racing to initialize from every thread
+        self._initialize_session()
+        
+        def exact_name(query: str) -> Optional[str]:
+            # The exact symbol need not be the top fuzzy hit, and other hits
+            # must not pass for its name
+            wanted = query.strip().upper()
+            for result in self.search_symbols(query):
+                if result['symbol'].strip().upper() == wanted:
+                    return result['name']
+            return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            names = executor.map(exact_name, queries)
+            found.update((query, name) for query, name in zip(queries, names) if name)
+        
+        return found
+    
+    def lookup_missing_names(self, symbols) -> Dict[str, str]:
+        """
+        Look up names missing from older watchlists in one batch and save them.
+        
+        Index and mutual fund names never come from the equity search, so
+        those symbols are skipped.
+        
+        Args:
+            symbols: Watchlist symbols
+        
+        Returns:
+            Dictionary mapping symbol name to the name found for it
+        """
+        missing_names = [
+            s.name for s in symbols
+            if not s.full_name and s.symbol_type not in (SymbolType.INDEX, SymbolType.MUTUAL_FUND)
+        ]
+        if not missing_names:
+            return {}
+        
+        try:
+            found_names = self.search_symbols_batch(missing_names)
+            # Save them so later loads don't need to search
+            if found_names:
+                storage.update_symbol_full_name(found_names)
+            return found_names
+        except Exception as e:
+            log(f"Error looking up symbol names: {e}")
+            return {}
 
 
 # Global instance
@@ -2,6 +2,7 @@
 Utility functions for financial calculations and formatting.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -37,6 +38,7 @@ def calculate_change_percent(current: float, previous: float) -> float:
     return ((current - previous) / previous) * 100
 
 
+@lru_cache(maxsize=4096)
 def format_currency(value: Optional[float], currency: str = "₹") -> str:
     """
     Format currency value with exact numbers and 2 decimal places.
@@ -55,6 +57,7 @@ def format_currency(value: Optional[float], currency: str = "₹") -> str:
     return f"{currency}{value:,.2f}"
 
 
+@lru_cache(maxsize=4096)
 def format_percentage(value: Optional[float], decimals: int = 2) -> str:
     """
     Format percentage value.
@@ -0,0 +1,83 @@
+"""
+MinMaxLTTB downsampling for plotting long price series.
+"""
+
+import numpy as np
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection.
+
+    Args:
+        x: Point x positions (ascending)
+        y: Point values
+        n_out: Number of points to keep
+
+    Returns:
+        Indices into x/y of the selected points, first and last always included
+    """
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # n_out - 2 buckets over the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i < n_out - 3 else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point forming the largest triangle with the last kept point
+        # and the average of the next bucket
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_lttb(values, n_out: int, minmax_ratio: int = 4) -> np.ndarray:
+    """
+    Pick n_out representative points from a series using MinMaxLTTB.
+
+    The series is first reduced to the min and max of n_out * minmax_ratio / 2
+    equal-width bins, then LTTB selects the final points from those candidates.
+
+    Args:
+        values: Series to downsample
+        n_out: Number of points to keep
+        minmax_ratio: Candidates preselected per output point (default: 4)
+
+    Returns:
+        Sorted indices into values of the points to plot
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    n_bins = n_out * minmax_ratio // 2
+    if n - 2 <= 2 * n_bins:
+        # Preselection would not reduce the series
+        return _lttb(np.arange(n, dtype=float), y, n_out)
+
+    edges = np.linspace(1, n - 1, n_bins + 1).astype(np.int64)
+    candidates = [0]
+    for start, end in zip(edges[:-1], edges[1:]):
+        segment = y[start:end]
+        candidates.append(start + int(np.argmin(segment)))
+        candidates.append(start + int(np.argmax(segment)))
+    candidates.append(n - 1)
+    candidates = np.unique(candidates)
+
+    return candidates[_lttb(candidates.astype(float), y[candidates], n_out)]
@@ -0,0 +1,20 @@
+"""
+Rich styles and price formatting shared by the watchlist and symbol screens.
+"""
+
+from rich.style import Style
+
+
+# Parsed once; passing Style objects skips Rich's style-string parsing per cell
+S_GREEN = Style(color="green", bold=True)
+S_RED = Style(color="red", bold=True)
+S_YELLOW = Style(color="yellow", bold=True)
+
+# Close style by sign of (close - previous close); unchanged closes stay plain
+CLOSE_STYLE = {1: S_GREEN, -1: S_RED, 0: None}
+
+# ETF premium style by bucket: < 5%, 5-10%, > 10% (absolute)
+PREMIUM_STYLE = (S_GREEN, S_YELLOW, S_RED)
+
+# Price cell formatting
+format_price = "₹%.2f".__mod__